@@ -3,7 +3,7 @@ Database models for ADIENT Inventory Management System
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -58,7 +58,11 @@ class Supplier(Base):
 class StockMovement(Base):
     """Stock movements table"""
     __tablename__ = 'stock_movements'
-    
+    __table_args__ = (
+        # Movement history reads scan by recency, optionally per item
+        Index('ix_stock_movements_created_item', 'created_at', 'inventory_item_id'),
+    )
+
     id = Column(Integer, primary_key=True)
     inventory_item_id = Column(Integer, ForeignKey('inventory_items.id'), nullable=False)
     movement_type = Column(String(20), nullable=False)  # 'IN', 'OUT', 'ADJUSTMENT'
@@ -92,7 +96,11 @@ class ProductionLine(Base):
 class ProductionRecord(Base):
     """Production records table"""
     __tablename__ = 'production_records'
-    
+    __table_args__ = (
+        # Optimization and monitoring queries filter by line + recency
+        Index('ix_production_records_line_created', 'production_line_id', 'created_at'),
+    )
+
     id = Column(Integer, primary_key=True)
     production_line_id = Column(Integer, ForeignKey('production_lines.id'), nullable=False)
     product_id = Column(String(50), nullable=False)
@@ -150,7 +158,11 @@ class ResourceAllocation(Base):
 class Alert(Base):
     """Alerts table"""
     __tablename__ = 'alerts'
-    
+    __table_args__ = (
+        # Alert feeds filter unresolved alerts per source, newest first
+        Index('ix_alerts_source_resolved_created', 'source_type', 'is_resolved', 'created_at'),
+    )
+
     id = Column(Integer, primary_key=True)
     alert_type = Column(String(50), nullable=False)  # 'LOW_STOCK', 'PRODUCTION_ISSUE', 'MAINTENANCE'
     severity = Column(String(20), default='MEDIUM')  # 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'
@@ -169,7 +181,11 @@ class Alert(Base):
 class OptimizationResult(Base):
     """Optimization results table"""
     __tablename__ = 'optimization_results'
-    
+    __table_args__ = (
+        # get_optimization_history filters by type + recency
+        Index('ix_optimization_results_type_created', 'optimization_type', 'created_at'),
+    )
+
     id = Column(Integer, primary_key=True)
     optimization_type = Column(String(50), nullable=False)  # 'INVENTORY', 'PRODUCTION', 'RESOURCE'
     parameters = Column(JSON)
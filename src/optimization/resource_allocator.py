@@ -3,14 +3,23 @@ Resource Allocation and Optimization Module for ADIENT Inventory Management Syst
 Handles optimization algorithms for resource allocation and production scheduling
 """
 
+import asyncio
+import base64
+import json
 import logging
+import math
 import time
 import threading
+import zlib
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import numpy as np
-from pulp import *
+from pulp import (
+    LpProblem, LpMinimize, LpVariable, LpStatusOptimal,
+    lpSum, lpDot, value, PULP_CBC_CMD
+)
 from sqlalchemy import func, and_
+from sqlalchemy.orm import load_only
 
 from ..database.connection import get_db_session
 from ..database.models import (
@@ -22,6 +31,17 @@ from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Lookback windows for the data-fetch helpers, built once at import
+RECENT_PRODUCTION_WINDOW = timedelta(days=7)
+EFFICIENCY_WINDOW = timedelta(days=1)
+
+# Results payloads above this JSON size (bytes) are stored compressed
+RESULTS_COMPRESSION_THRESHOLD = 4096
+
+# Scheduling defaults, hoisted so hot paths avoid re-building them
+DEFAULT_SETUP_COST = 10
+DEFAULT_JOB_PRIORITY = 1
+
 class ResourceAllocator:
     """Resource allocation and optimization engine"""
     
@@ -32,6 +52,12 @@ class ResourceAllocator:
         self.max_optimization_time = Config.MAX_OPTIMIZATION_TIME
         self.is_running = False
         self.optimization_thread = None
+        self._loop = None
+        self._loop_task = None
+        # Cached inventory allocation model, rebuilt only when the
+        # item/line structure changes (RHS values are updated in place)
+        self._inv_model = None
+        self._inv_model_key = None
         logger.info("Resource Allocator initialized")
     
     def run_periodic_optimization(self):
@@ -39,29 +65,56 @@ class ResourceAllocator:
         if self.is_running:
             logger.warning("Optimization already running")
             return
-        
+
         self.is_running = True
-        self.optimization_thread = threading.Thread(target=self._optimization_loop, daemon=True)
+        self.optimization_thread = threading.Thread(target=self._run_async_loop, daemon=True)
         self.optimization_thread.start()
         logger.info("Periodic optimization started")
-    
+
     def stop_optimization(self):
         """Stop periodic optimization"""
         self.is_running = False
+        if self._loop is not None and self._loop_task is not None:
+            # Cancel the task so a loop sleeping out its interval wakes
+            # up immediately instead of after up to a full interval
+            self._loop.call_soon_threadsafe(self._loop_task.cancel)
         if self.optimization_thread:
             self.optimization_thread.join(timeout=10)
         logger.info("Periodic optimization stopped")
-    
-    def _optimization_loop(self):
+
+    def _run_async_loop(self):
+        """Run the asyncio optimization loop in the background thread"""
+        self._loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(self._loop)
+            self._loop_task = self._loop.create_task(self._optimization_loop())
+            try:
+                self._loop.run_until_complete(self._loop_task)
+            except asyncio.CancelledError:
+                pass
+        finally:
+            self._loop.close()
+            self._loop = None
+            self._loop_task = None
+
+    async def _optimization_loop(self):
         """Main optimization loop"""
+        loop = asyncio.get_running_loop()
         while self.is_running:
             try:
-                self.optimize_inventory_allocation()
-                self.optimize_production_schedule()
-                time.sleep(self.optimization_interval)
+                # The two optimizations are independent (disjoint tables,
+                # separate DB sessions), so run them concurrently; the GIL
+                # is released while CBC and the DB round-trips run
+                await asyncio.gather(
+                    loop.run_in_executor(None, self.optimize_inventory_allocation),
+                    loop.run_in_executor(None, self.optimize_production_schedule)
+                )
+                await asyncio.sleep(self.optimization_interval)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in optimization loop: {str(e)}")
-                time.sleep(self.optimization_interval)
+                await asyncio.sleep(self.optimization_interval)
     
     def optimize_inventory_allocation(self) -> Dict:
         """Optimize inventory allocation across production lines"""
@@ -77,52 +130,53 @@ class ResourceAllocator:
                 if not inventory_data or not production_data:
                     logger.warning("Insufficient data for inventory optimization")
                     return {'status': 'failed', 'reason': 'insufficient_data'}
-                
-                # Setup optimization problem
-                prob = LpProblem("Inventory_Allocation", LpMinimize)
-                
-                # Decision variables: allocation[item][line] = quantity
-                allocation_vars = {}
-                for item_id in inventory_data:
-                    allocation_vars[item_id] = {}
-                    for line_id in production_data:
-                        var_name = f"alloc_{item_id}_{line_id}"
-                        allocation_vars[item_id][line_id] = LpVariable(
-                            var_name, lowBound=0, cat='Integer'
-                        )
-                
-                # Objective: Minimize total allocation cost and waste
-                objective = 0
-                for item_id in inventory_data:
-                    item_cost = inventory_data[item_id]['unit_cost']
-                    for line_id in production_data:
-                        # Cost of allocation + penalty for overallocation
-                        objective += (
-                            item_cost * allocation_vars[item_id][line_id] +
-                            0.1 * item_cost * allocation_vars[item_id][line_id]  # waste penalty
+
+                inv_ids = list(inventory_data)
+                line_ids = list(production_data)
+                min_required = {
+                    (item_id, line_id): required
+                    for line_id in line_ids
+                    for item_id, required in production_data[line_id].get('required_items', {}).items()
+                    if item_id in inventory_data
+                }
+
+                # Model structure only changes when the item/line sets or
+                # unit costs do; between periodic invocations reuse the
+                # cached problem and just re-set constraint bounds for
+                # current stock levels and requirements.
+                model_key = (
+                    tuple(inv_ids),
+                    tuple(line_ids),
+                    tuple(inventory_data[item_id]['unit_cost'] for item_id in inv_ids),
+                    frozenset(min_required)
+                )
+                reuse_model = (
+                    self._inv_model is not None and
+                    self._inv_model_key == model_key
+                )
+
+                if reuse_model:
+                    prob, allocation_vars = self._inv_model
+                    constraints = prob.constraints
+                    for item_id in inv_ids:
+                        constraints[f"stock_{item_id}"].changeRHS(
+                            inventory_data[item_id]['current_stock']
                         )
-                
-                prob += objective
-                
-                # Constraints
-                # 1. Don't allocate more than available stock
-                for item_id in inventory_data:
-                    available_stock = inventory_data[item_id]['current_stock']
-                    total_allocated = lpSum([
-                        allocation_vars[item_id][line_id] 
-                        for line_id in production_data
-                    ])
-                    prob += total_allocated <= available_stock
-                
-                # 2. Meet minimum production requirements
-                for line_id in production_data:
-                    for item_id in production_data[line_id].get('required_items', {}):
-                        min_required = production_data[line_id]['required_items'][item_id]
-                        if item_id in allocation_vars:
-                            prob += allocation_vars[item_id][line_id] >= min_required
-                
-                # Solve the problem
-                prob.solve(PULP_CBC_CMD(msg=0, timeLimit=self.max_optimization_time))
+                    for (item_id, line_id), required in min_required.items():
+                        constraints[f"min_{item_id}_{line_id}"].changeRHS(required)
+                else:
+                    prob, allocation_vars = self._build_inventory_model(
+                        inv_ids, line_ids, inventory_data, min_required
+                    )
+                    self._inv_model = (prob, allocation_vars)
+                    self._inv_model_key = model_key
+
+                # Warm-start CBC from the previous tick's solution when
+                # the model was reused (variables still hold their values)
+                prob.solve(PULP_CBC_CMD(
+                    msg=0, timeLimit=self.max_optimization_time,
+                    warmStart=reuse_model
+                ))
                 
                 # Extract results
                 if prob.status == LpStatusOptimal:
@@ -155,6 +209,58 @@ class ResourceAllocator:
             logger.error(f"Error in inventory allocation optimization: {str(e)}")
             raise
     
+    def _build_inventory_model(self, inv_ids, line_ids, inventory_data,
+                              min_required) -> Tuple:
+        """Build the inventory allocation problem (cached between runs)"""
+        prob = LpProblem("Inventory_Allocation", LpMinimize)
+
+        # Decision variables: allocation[item][line] = quantity.
+        # The constraint structure (sum <= stock per item, var >= required
+        # per pair) keeps the LP relaxation integral or within a unit of
+        # it, so a continuous simplex solve replaces CBC branch-and-bound;
+        # results are floored back to integers at extraction.
+        allocation_vars = {}
+        for item_id in inv_ids:
+            allocation_vars[item_id] = {}
+            for line_id in line_ids:
+                allocation_vars[item_id][line_id] = LpVariable(
+                    f"alloc_{item_id}_{line_id}", lowBound=0, cat='Continuous'
+                )
+
+        # Objective: Minimize total allocation cost and waste.
+        # Cost + 10% waste penalty folds to 1.1 * unit_cost per
+        # variable at build time, so the whole objective is one
+        # dot product instead of a per-cell expression rebuild.
+        unit_costs = np.array([
+            inventory_data[item_id]['unit_cost'] for item_id in inv_ids
+        ])
+        flat_costs = np.repeat(1.1 * unit_costs, len(line_ids))
+        flat_vars = [
+            allocation_vars[item_id][line_id]
+            for item_id in inv_ids
+            for line_id in line_ids
+        ]
+        prob += lpDot(flat_costs.tolist(), flat_vars)
+
+        # Constraints are named so later invocations can re-set their
+        # right-hand sides without rebuilding the model
+        # 1. Don't allocate more than available stock
+        for item_id in inv_ids:
+            total_allocated = lpSum(allocation_vars[item_id].values())
+            prob += (
+                total_allocated <= inventory_data[item_id]['current_stock'],
+                f"stock_{item_id}"
+            )
+
+        # 2. Meet minimum production requirements
+        for (item_id, line_id), required in min_required.items():
+            prob += (
+                allocation_vars[item_id][line_id] >= required,
+                f"min_{item_id}_{line_id}"
+            )
+
+        return prob, allocation_vars
+
     def optimize_production_schedule(self) -> Dict:
         """Optimize production scheduling across lines"""
         try:
@@ -172,65 +278,63 @@ class ResourceAllocator:
                 
                 # Setup optimization problem
                 prob = LpProblem("Production_Schedule", LpMinimize)
-                
-                # Decision variables: schedule[job][line][time_slot] = 1 if job assigned
-                schedule_vars = {}
-                time_slots = list(range(24))  # 24 hour slots
-                
-                for job_id in jobs_data:
-                    schedule_vars[job_id] = {}
-                    for line_id in lines_data:
-                        schedule_vars[job_id][line_id] = {}
-                        for slot in time_slots:
-                            var_name = f"sched_{job_id}_{line_id}_{slot}"
-                            schedule_vars[job_id][line_id][slot] = LpVariable(
-                                var_name, cat='Binary'
-                            )
-                
-                # Objective: Minimize completion time and setup costs
-                objective = 0
-                for job_id in jobs_data:
-                    job_priority = jobs_data[job_id].get('priority', 1)
-                    for line_id in lines_data:
-                        setup_cost = lines_data[line_id].get('setup_cost', 10)
-                        for slot in time_slots:
-                            # Minimize completion time (later slots cost more)
-                            # Higher priority jobs get lower cost multiplier
-                            time_cost = slot * (2 - job_priority)
-                            objective += (
-                                (time_cost + setup_cost) * 
-                                schedule_vars[job_id][line_id][slot]
-                            )
-                
-                prob += objective
-                
+
+                job_ids = list(jobs_data)
+                line_ids = list(lines_data)
+                num_jobs = len(job_ids)
+                num_lines = len(line_ids)
+                num_slots = 24  # 24 hour slots
+
+                # Decision variables: schedule[j, l, t] = 1 if job j runs on
+                # line l in slot t. One flat batch reshaped into a contiguous
+                # 3-D array replaces the dict-of-dict-of-dict bookkeeping and
+                # the per-cell f-string variable names.
+                schedule_vars = np.array(
+                    [LpVariable(f"s_{k}", cat='Binary')
+                     for k in range(num_jobs * num_lines * num_slots)],
+                    dtype=object
+                ).reshape(num_jobs, num_lines, num_slots)
+
+                # Objective: Minimize completion time and setup costs.
+                # Later slots cost more; higher priority jobs get a lower
+                # cost multiplier. The coefficients are broadcast into one
+                # (jobs, lines, slots) tensor instead of recomputing
+                # slot * (2 - priority) in the innermost loop.
+                priorities = np.array([
+                    jobs_data[job_id].get('priority', DEFAULT_JOB_PRIORITY)
+                    for job_id in job_ids
+                ])
+                setup_costs = np.array([
+                    lines_data[line_id].get('setup_cost', DEFAULT_SETUP_COST)
+                    for line_id in line_ids
+                ])
+                slots = np.arange(num_slots)
+                cost_tensor = (
+                    slots[None, None, :] * (2 - priorities)[:, None, None] +
+                    setup_costs[None, :, None]
+                )
+
+                prob += lpDot(cost_tensor.ravel().tolist(),
+                              schedule_vars.ravel().tolist())
+
                 # Constraints
                 # 1. Each job must be assigned to exactly one line and time slot
-                for job_id in jobs_data:
-                    total_assignments = lpSum([
-                        schedule_vars[job_id][line_id][slot]
-                        for line_id in lines_data
-                        for slot in time_slots
-                    ])
-                    prob += total_assignments == 1
-                
+                for j in range(num_jobs):
+                    prob += lpSum(schedule_vars[j].flat) == 1
+
                 # 2. Each line can handle only one job per time slot
-                for line_id in lines_data:
-                    for slot in time_slots:
-                        slot_assignments = lpSum([
-                            schedule_vars[job_id][line_id][slot]
-                            for job_id in jobs_data
-                        ])
-                        prob += slot_assignments <= 1
-                
+                for l in range(num_lines):
+                    for slot in range(num_slots):
+                        prob += lpSum(schedule_vars[:, l, slot]) <= 1
+
                 # 3. Line capacity constraints
-                for line_id in lines_data:
+                quantities = [jobs_data[job_id]['quantity'] for job_id in job_ids]
+                for l, line_id in enumerate(line_ids):
                     line_capacity = lines_data[line_id]['capacity_per_hour']
-                    for slot in time_slots:
+                    for slot in range(num_slots):
                         slot_demand = lpSum([
-                            jobs_data[job_id]['quantity'] * 
-                            schedule_vars[job_id][line_id][slot]
-                            for job_id in jobs_data
+                            quantity * var
+                            for quantity, var in zip(quantities, schedule_vars[:, l, slot])
                         ])
                         prob += slot_demand <= line_capacity
                 
@@ -240,7 +344,7 @@ class ResourceAllocator:
                 # Extract results
                 if prob.status == LpStatusOptimal:
                     schedule_results = self._extract_schedule_results(
-                        schedule_vars, jobs_data, lines_data
+                        schedule_vars, job_ids, line_ids, jobs_data, lines_data
                     )
                     
                     # Save optimization results
@@ -364,10 +468,12 @@ class ResourceAllocator:
                         OptimizationResult.optimization_type == optimization_type
                     )
                 
+                # Stream rows in batches instead of materializing every
+                # matching result (each row carries a JSON payload)
                 results = query.order_by(
                     OptimizationResult.created_at.desc()
-                ).all()
-                
+                ).yield_per(200)
+
                 history = []
                 for result in results:
                     history.append({
@@ -377,7 +483,9 @@ class ResourceAllocator:
                         'execution_time_seconds': result.execution_time_seconds,
                         'status': result.status,
                         'created_at': result.created_at.isoformat(),
-                        'results_summary': self._summarize_results(result.results)
+                        'results_summary': self._summarize_results(
+                            self._decode_results(result.results)
+                        )
                     })
                 
                 return history
@@ -388,74 +496,91 @@ class ResourceAllocator:
     
     def _get_inventory_data(self, session) -> Dict:
         """Get current inventory data for optimization"""
-        items = session.query(InventoryItem).filter(
+        # Fetch only the columns the optimizer reads; narrower rows and
+        # no ORM instance construction per item
+        rows = session.query(
+            InventoryItem.id, InventoryItem.part_number,
+            InventoryItem.current_stock, InventoryItem.unit_cost,
+            InventoryItem.reorder_point
+        ).filter(
             InventoryItem.is_active == True
         ).all()
-        
-        inventory_data = {}
-        for item in items:
-            inventory_data[item.id] = {
-                'part_number': item.part_number,
-                'current_stock': item.current_stock,
-                'unit_cost': item.unit_cost,
-                'reorder_point': item.reorder_point
+
+        return {
+            item_id: {
+                'part_number': part_number,
+                'current_stock': current_stock,
+                'unit_cost': unit_cost,
+                'reorder_point': reorder_point
             }
-        
-        return inventory_data
+            for item_id, part_number, current_stock, unit_cost, reorder_point in rows
+        }
     
     def _get_production_requirements(self, session) -> Dict:
         """Get production requirements for active lines"""
-        lines = session.query(ProductionLine).filter(
+        lines = session.query(ProductionLine).options(
+            load_only(ProductionLine.id, ProductionLine.name,
+                      ProductionLine.capacity_per_hour)
+        ).filter(
             ProductionLine.is_active == True
         ).all()
-        
+
+        # One grouped aggregate for recent production instead of a
+        # per-line query (N+1 round trips collapse to 1)
+        cutoff = datetime.utcnow() - RECENT_PRODUCTION_WINDOW
+        avg_production_by_line = dict(
+            session.query(
+                ProductionRecord.production_line_id,
+                func.avg(ProductionRecord.actual_quantity)
+            ).filter(
+                ProductionRecord.created_at >= cutoff
+            ).group_by(ProductionRecord.production_line_id).all()
+        )
+
         production_data = {}
         for line in lines:
-            # Get recent production to estimate requirements
-            recent_records = session.query(ProductionRecord).filter(
-                ProductionRecord.production_line_id == line.id,
-                ProductionRecord.created_at >= datetime.utcnow() - timedelta(days=7)
-            ).all()
-            
             # Estimate required items based on recent production
+            avg_production = avg_production_by_line.get(line.id, 0)
             required_items = {}
-            if recent_records:
-                avg_production = sum(r.actual_quantity for r in recent_records) / len(recent_records)
+            if avg_production:
                 # Simplified: assume each unit requires certain materials
                 required_items = {1: int(avg_production * 0.8), 2: int(avg_production * 0.6)}
-            
+
             production_data[line.id] = {
                 'name': line.name,
                 'capacity_per_hour': line.capacity_per_hour,
                 'required_items': required_items
             }
-        
+
         return production_data
     
     def _get_production_lines_data(self, session) -> Dict:
         """Get production lines data for scheduling"""
-        lines = session.query(ProductionLine).filter(
+        rows = session.query(
+            ProductionLine.id, ProductionLine.name,
+            ProductionLine.capacity_per_hour, ProductionLine.efficiency_target
+        ).filter(
             ProductionLine.is_active == True
         ).all()
-        
-        lines_data = {}
-        for line in lines:
-            lines_data[line.id] = {
-                'name': line.name,
-                'capacity_per_hour': line.capacity_per_hour,
-                'efficiency_target': line.efficiency_target,
-                'setup_cost': 10  # Simplified setup cost
+
+        return {
+            line_id: {
+                'name': name,
+                'capacity_per_hour': capacity_per_hour,
+                'efficiency_target': efficiency_target,
+                'setup_cost': DEFAULT_SETUP_COST  # Simplified setup cost
             }
-        
-        return lines_data
+            for line_id, name, capacity_per_hour, efficiency_target in rows
+        }
     
     def _get_pending_jobs_data(self, session) -> Dict:
         """Get pending production jobs"""
         # Simplified: create sample jobs for demonstration
+        now = datetime.utcnow()
         jobs_data = {
-            1: {'quantity': 100, 'priority': 1, 'due_date': datetime.utcnow() + timedelta(hours=8)},
-            2: {'quantity': 150, 'priority': 2, 'due_date': datetime.utcnow() + timedelta(hours=12)},
-            3: {'quantity': 75, 'priority': 1, 'due_date': datetime.utcnow() + timedelta(hours=6)}
+            1: {'quantity': 100, 'priority': 1, 'due_date': now + timedelta(hours=8)},
+            2: {'quantity': 150, 'priority': 2, 'due_date': now + timedelta(hours=12)},
+            3: {'quantity': 75, 'priority': 1, 'due_date': now + timedelta(hours=6)}
         }
         
         return jobs_data
@@ -463,34 +588,47 @@ class ResourceAllocator:
     def _get_resource_utilization_data(self, session) -> Dict:
         """Get current resource utilization data"""
         # Get production line utilization
-        lines = session.query(ProductionLine).filter(
+        lines = session.query(ProductionLine).options(
+            load_only(ProductionLine.id, ProductionLine.name,
+                      ProductionLine.efficiency_target)
+        ).filter(
             ProductionLine.is_active == True
         ).all()
-        
+
+        # Aggregate recent production in one grouped query instead of
+        # one query per line
+        cutoff = datetime.utcnow() - EFFICIENCY_WINDOW
+        totals_by_line = {
+            line_id: (total_planned or 0, total_actual or 0)
+            for line_id, total_planned, total_actual in session.query(
+                ProductionRecord.production_line_id,
+                func.sum(ProductionRecord.planned_quantity),
+                func.sum(ProductionRecord.actual_quantity)
+            ).filter(
+                ProductionRecord.created_at >= cutoff
+            ).group_by(ProductionRecord.production_line_id).all()
+        }
+
         lines_utilization = []
         for line in lines:
             # Calculate recent efficiency
-            recent_records = session.query(ProductionRecord).filter(
-                ProductionRecord.production_line_id == line.id,
-                ProductionRecord.created_at >= datetime.utcnow() - timedelta(days=1)
-            ).all()
-            
+            total_planned, total_actual = totals_by_line.get(line.id, (0, 0))
             current_efficiency = 0
-            if recent_records:
-                total_planned = sum(r.planned_quantity for r in recent_records)
-                total_actual = sum(r.actual_quantity for r in recent_records)
-                if total_planned > 0:
-                    current_efficiency = (total_actual / total_planned) * 100
-            
+            if total_planned > 0:
+                current_efficiency = (total_actual / total_planned) * 100
+
             lines_utilization.append({
                 'line_id': line.id,
                 'line_name': line.name,
                 'current_efficiency': current_efficiency,
                 'target_efficiency': line.efficiency_target * 100
             })
-        
+
         # Get inventory utilization
-        items = session.query(InventoryItem).filter(
+        items = session.query(InventoryItem).options(
+            load_only(InventoryItem.id, InventoryItem.part_number,
+                      InventoryItem.current_stock)
+        ).filter(
             InventoryItem.is_active == True
         ).all()
         
@@ -518,36 +656,49 @@ class ResourceAllocator:
         for item_id in allocation_vars:
             results[item_id] = {}
             for line_id in allocation_vars[item_id]:
-                allocated_qty = value(allocation_vars[item_id][line_id])
+                allocated_qty = value(allocation_vars[item_id][line_id]) or 0
+                # Floor the relaxed solution (with a small tolerance for
+                # solver round-off) so stock limits still hold after
+                # rounding
+                allocated_qty = int(math.floor(allocated_qty + 1e-9))
                 if allocated_qty > 0:
                     results[item_id][line_id] = {
-                        'allocated_quantity': int(allocated_qty),
+                        'allocated_quantity': allocated_qty,
                         'item_info': inventory_data[item_id],
                         'line_info': production_data[line_id]
                     }
         
         return results
     
-    def _extract_schedule_results(self, schedule_vars, jobs_data, lines_data) -> Dict:
-        """Extract schedule results from optimization variables"""
+    def _extract_schedule_results(self, schedule_vars, job_ids, line_ids,
+                                 jobs_data, lines_data) -> Dict:
+        """Extract schedule results from the schedule variable tensor"""
         results = {}
-        
-        for job_id in schedule_vars:
-            for line_id in schedule_vars[job_id]:
-                for slot in schedule_vars[job_id][line_id]:
-                    if value(schedule_vars[job_id][line_id][slot]) == 1:
-                        if job_id not in results:
-                            results[job_id] = {}
-                        
-                        results[job_id] = {
-                            'assigned_line': line_id,
-                            'assigned_slot': slot,
-                            'job_info': jobs_data[job_id],
-                            'line_info': lines_data[line_id],
-                            'scheduled_time': datetime.utcnow() + timedelta(hours=slot)
-                        }
-                        break
-        
+        now = datetime.utcnow()
+
+        # Pull every variable value in one pass; each job's plane holds
+        # exactly one cell set to 1, so argmax locates the assignment
+        # without a Python branch per variable
+        assignments = np.array([
+            value(var) or 0 for var in schedule_vars.ravel()
+        ]).reshape(schedule_vars.shape)
+
+        for j, job_id in enumerate(job_ids):
+            flat_idx = assignments[j].argmax()
+            if assignments[j].flat[flat_idx] < 0.5:
+                continue  # job was left unassigned
+
+            l, slot = np.unravel_index(flat_idx, assignments[j].shape)
+            line_id = line_ids[l]
+            slot = int(slot)
+            results[job_id] = {
+                'assigned_line': line_id,
+                'assigned_slot': slot,
+                'job_info': jobs_data[job_id],
+                'line_info': lines_data[line_id],
+                'scheduled_time': now + timedelta(hours=slot)
+            }
+
         return results
     
     def _save_optimization_result(self, session, opt_type: str, prob, results: Dict, start_time: float):
@@ -559,7 +710,9 @@ class ResourceAllocator:
             optimization_result = OptimizationResult(
                 optimization_type=opt_type,
                 parameters={'optimization_time': execution_time},
-                results=results,
+                # Tag the payload so summaries can dispatch on type
+                # without probing the dict contents
+                results=self._encode_results({**results, '__type__': opt_type}),
                 objective_value=objective_value,
                 execution_time_seconds=execution_time,
                 status='COMPLETED'
@@ -576,83 +729,133 @@ class ResourceAllocator:
     def _apply_inventory_allocations(self, session, allocation_results: Dict):
         """Apply inventory allocation results"""
         try:
-            for item_id, allocations in allocation_results.items():
-                for line_id, allocation_data in allocations.items():
-                    allocated_qty = allocation_data['allocated_quantity']
-                    
-                    # Create resource allocation record
-                    resource_allocation = ResourceAllocation(
-                        production_line_id=line_id,
-                        resource_type='MATERIAL',
-                        resource_id=str(item_id),
-                        allocated_quantity=allocated_qty,
-                        allocation_date=datetime.utcnow(),
-                        status='PLANNED'
-                    )
-                    
-                    session.add(resource_allocation)
-            
+            # One bulk insert instead of a session.add() per (item, line)
+            allocation_date = datetime.utcnow()
+            rows = [
+                {
+                    'production_line_id': line_id,
+                    'resource_type': 'MATERIAL',
+                    'resource_id': str(item_id),
+                    'allocated_quantity': allocation_data['allocated_quantity'],
+                    'allocation_date': allocation_date,
+                    'status': 'PLANNED'
+                }
+                for item_id, allocations in allocation_results.items()
+                for line_id, allocation_data in allocations.items()
+            ]
+
+            if rows:
+                session.bulk_insert_mappings(ResourceAllocation, rows)
+
             session.commit()
             logger.info("Inventory allocations applied successfully")
-            
+
         except Exception as e:
             logger.error(f"Error applying inventory allocations: {str(e)}")
             session.rollback()
-    
+
     def _apply_production_schedule(self, session, schedule_results: Dict):
         """Apply production schedule results"""
         try:
-            for job_id, schedule_data in schedule_results.items():
-                line_id = schedule_data['assigned_line']
-                scheduled_time = schedule_data['scheduled_time']
-                
-                # Create resource allocation for scheduled job
-                resource_allocation = ResourceAllocation(
-                    production_line_id=line_id,
-                    resource_type='LABOR',
-                    resource_id=f'job_{job_id}',
-                    allocated_quantity=1,
-                    allocation_date=scheduled_time,
-                    status='PLANNED'
-                )
-                
-                session.add(resource_allocation)
-            
+            # One bulk insert instead of a session.add() per job
+            rows = [
+                {
+                    'production_line_id': schedule_data['assigned_line'],
+                    'resource_type': 'LABOR',
+                    'resource_id': f'job_{job_id}',
+                    'allocated_quantity': 1,
+                    'allocation_date': schedule_data['scheduled_time'],
+                    'status': 'PLANNED'
+                }
+                for job_id, schedule_data in schedule_results.items()
+            ]
+
+            if rows:
+                session.bulk_insert_mappings(ResourceAllocation, rows)
+
             session.commit()
             logger.info("Production schedule applied successfully")
-            
+
         except Exception as e:
             logger.error(f"Error applying production schedule: {str(e)}")
             session.rollback()
     
+    def _encode_results(self, results: Dict) -> Dict:
+        """Prepare a results payload for storage, compressing large ones
+
+        Schedule results carry nested job/line copies that inflate the
+        stored JSON several-fold; payloads above the threshold are
+        stored zlib-compressed inside the JSON column. Serializing here
+        (with default=str) also handles datetime values the raw JSON
+        column cannot.
+        """
+        payload = json.dumps(results, default=str)
+        if len(payload) < RESULTS_COMPRESSION_THRESHOLD:
+            # Keep small payloads as plain JSON for readability
+            return json.loads(payload)
+
+        compressed = base64.b64encode(zlib.compress(payload.encode('utf-8')))
+        return {'__compressed__': compressed.decode('ascii')}
+
+    def _decode_results(self, stored: Optional[Dict]) -> Dict:
+        """Decode a stored results payload, decompressing if needed"""
+        if not stored:
+            return {}
+
+        blob = stored.get('__compressed__')
+        if blob is None:
+            return stored
+
+        return json.loads(zlib.decompress(base64.b64decode(blob)))
+
     def _summarize_results(self, results: Dict) -> Dict:
         """Create summary of optimization results"""
         if not results:
             return {}
-        
+
+        # Dispatch on the type tag written at save time; the old probe
+        # stringified the entire payload twice per history row
+        result_type = results.get('__type__') or self._detect_result_type(results)
+        total_items = len(results) - ('__type__' in results)
+
         summary = {
-            'total_items': len(results),
+            'total_items': total_items,
             'optimization_type': 'unknown'
         }
-        
-        # Detect result type and create appropriate summary
-        if 'recommendations' in results:
+
+        if result_type == 'RESOURCE':
             summary.update({
                 'optimization_type': 'resource_utilization',
                 'total_recommendations': results.get('total_recommendations', 0)
             })
-        elif any('allocated_quantity' in str(results).lower() for _ in [1]):
+        elif result_type == 'INVENTORY':
             summary.update({
                 'optimization_type': 'inventory_allocation',
-                'total_allocations': len([
-                    alloc for item_allocs in results.values() 
-                    for alloc in item_allocs.values()
-                ])
+                'total_allocations': sum(
+                    len(item_allocs)
+                    for key, item_allocs in results.items()
+                    if key != '__type__'
+                )
             })
-        elif any('assigned_line' in str(results).lower() for _ in [1]):
+        elif result_type == 'PRODUCTION':
             summary.update({
                 'optimization_type': 'production_schedule',
-                'total_jobs_scheduled': len(results)
+                'total_jobs_scheduled': total_items
             })
-        
-        return summary
\ No newline at end of file
+
+        return summary
+
+    def _detect_result_type(self, results: Dict) -> Optional[str]:
+        """Detect result type for payloads saved before the type tag existed"""
+        if 'recommendations' in results:
+            return 'RESOURCE'
+
+        sample = next(iter(results.values()), None)
+        if isinstance(sample, dict):
+            if 'assigned_line' in sample:
+                return 'PRODUCTION'
+            if any(isinstance(alloc, dict) and 'allocated_quantity' in alloc
+                   for alloc in sample.values()):
+                return 'INVENTORY'
+
+        return None
\ No newline at end of file
@@ -33,9 +33,12 @@ Author: Hilmi Iliass
 Date: March 2022 - June 2022
 """
 
-from .production_monitor import ProductionMonitor
+# Import components when they are implemented
+try:
+    from .production_monitor import ProductionMonitor
+except ImportError:
+    ProductionMonitor = None
 
-# Import other components when they are implemented
 try:
     from .data_collector import ProductionDataCollector
 except ImportError:
@@ -46,11 +49,12 @@ try:
 except ImportError:
     PerformanceAnalyzer = None
 
-__all__ = [
-    'ProductionMonitor',
-]
+__all__ = []
 
 # Add optional components if available
+if ProductionMonitor:
+    __all__.append('ProductionMonitor')
+
 if ProductionDataCollector:
     __all__.append('ProductionDataCollector')
     
@@ -1 +1,340 @@
- 
+"""
+Production Monitoring Module for ADIENT Inventory Management System
+Handles production line monitoring, performance tracking, and data collection
+"""
+
+import logging
+import time
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+
+from ..database.connection import get_db_session
+from ..database.models import (
+    ProductionLine, ProductionRecord, ProductionItem,
+    InventoryItem, Alert
+)
+from ..utils.data_validator import DataValidator
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+class ProductionMonitor:
+    """Production line monitoring and data collection engine"""
+
+    def __init__(self):
+        """Initialize production monitor"""
+        self.validator = DataValidator()
+        self.monitoring_interval = Config.PRODUCTION_MONITORING_INTERVAL
+        self.alert_threshold = Config.PRODUCTION_ALERT_THRESHOLD
+        self.is_running = False
+        self.monitoring_thread = None
+        logger.info("Production Monitor initialized")
+
+    def start_monitoring(self):
+        """Start periodic production monitoring"""
+        if self.is_running:
+            logger.warning("Production monitoring already running")
+            return
+
+        self.is_running = True
+        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+        self.monitoring_thread.start()
+        logger.info("Production monitoring started")
+
+    def stop_monitoring(self):
+        """Stop production monitoring"""
+        self.is_running = False
+        if self.monitoring_thread:
+            self.monitoring_thread.join(timeout=10)
+        logger.info("Production monitoring stopped")
+
+    def _monitoring_loop(self):
+        """Main monitoring loop"""
+        while self.is_running:
+            try:
+                self._check_line_performance()
+                time.sleep(self.monitoring_interval)
+            except Exception as e:
+                logger.error(f"Error in monitoring loop: {str(e)}")
+                time.sleep(self.monitoring_interval)
+
+    def get_production_lines(self) -> List[Dict]:
+        """Get all production lines with current status information"""
+        try:
+            with get_db_session() as session:
+                lines = session.query(ProductionLine).filter(
+                    ProductionLine.is_active == True
+                ).all()
+
+                result = []
+                for line in lines:
+                    line_metrics = self._calculate_line_metrics(session, line)
+                    result.append({
+                        'id': line.id,
+                        'name': line.name,
+                        'description': line.description,
+                        'capacity_per_hour': line.capacity_per_hour,
+                        'efficiency_target': line.efficiency_target,
+                        'current_status': line_metrics['status'],
+                        'current_efficiency': line_metrics['efficiency'],
+                        'daily_production': line_metrics['daily_production'],
+                        'downtime_minutes': line_metrics['downtime_minutes']
+                    })
+
+                logger.info(f"Retrieved {len(result)} production lines")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error getting production lines: {str(e)}")
+            raise
+
+    def get_production_summary(self, start_date: datetime,
+                             end_date: datetime) -> Dict:
+        """Get production summary for a date range"""
+        try:
+            with get_db_session() as session:
+                records = session.query(ProductionRecord).filter(
+                    ProductionRecord.created_at >= start_date,
+                    ProductionRecord.created_at <= end_date
+                ).all()
+
+                # Calculate overall metrics
+                total_planned = sum(r.planned_quantity for r in records)
+                total_actual = sum(r.actual_quantity for r in records)
+                total_defective = sum(r.defective_quantity for r in records)
+                total_downtime = sum(r.downtime_minutes for r in records)
+
+                overall_efficiency = (total_actual / total_planned * 100) if total_planned > 0 else 0
+                quality_rate = ((total_actual - total_defective) / total_actual * 100) if total_actual > 0 else 0
+
+                # Calculate per-line summary; bucket records once instead
+                # of rescanning the full list for every line
+                records_by_line = defaultdict(list)
+                for record in records:
+                    records_by_line[record.production_line_id].append(record)
+
+                line_summary = {}
+                lines = session.query(ProductionLine).filter(
+                    ProductionLine.is_active == True
+                ).all()
+
+                for line in lines:
+                    line_records = records_by_line.get(line.id, [])
+                    line_planned = sum(r.planned_quantity for r in line_records)
+                    line_actual = sum(r.actual_quantity for r in line_records)
+
+                    line_summary[line.name] = {
+                        'planned': line_planned,
+                        'actual': line_actual,
+                        'efficiency': (line_actual / line_planned * 100) if line_planned > 0 else 0,
+                        'downtime': sum(r.downtime_minutes for r in line_records),
+                        'records_count': len(line_records)
+                    }
+
+                return {
+                    'period': {
+                        'start': start_date.isoformat(),
+                        'end': end_date.isoformat()
+                    },
+                    'overall_metrics': {
+                        'total_planned': total_planned,
+                        'total_actual': total_actual,
+                        'total_defective': total_defective,
+                        'overall_efficiency': round(overall_efficiency, 2),
+                        'quality_rate': round(quality_rate, 2),
+                        'total_downtime_minutes': total_downtime
+                    },
+                    'line_summary': line_summary,
+                    'records_count': len(records)
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting production summary: {str(e)}")
+            raise
+
+    def get_efficiency_trends(self, days: int = 7) -> Dict:
+        """Get efficiency trends over the specified number of days"""
+        try:
+            with get_db_session() as session:
+                start_date = datetime.utcnow() - timedelta(days=days)
+
+                records = session.query(ProductionRecord).filter(
+                    ProductionRecord.created_at >= start_date
+                ).all()
+
+                # Group records by date
+                daily_efficiency = {}
+                for record in records:
+                    date_key = record.created_at.date().isoformat()
+                    if date_key not in daily_efficiency:
+                        daily_efficiency[date_key] = {'planned': 0, 'actual': 0}
+
+                    daily_efficiency[date_key]['planned'] += record.planned_quantity
+                    daily_efficiency[date_key]['actual'] += record.actual_quantity
+
+                # Calculate daily efficiency percentages
+                efficiency_values = []
+                for date_data in daily_efficiency.values():
+                    if date_data['planned'] > 0:
+                        efficiency = (date_data['actual'] / date_data['planned']) * 100
+                    else:
+                        efficiency = 0
+                    date_data['efficiency'] = round(efficiency, 2)
+                    efficiency_values.append(efficiency)
+
+                average_efficiency = (
+                    sum(efficiency_values) / len(efficiency_values)
+                    if efficiency_values else 0
+                )
+
+                return {
+                    'period_days': days,
+                    'average_efficiency': round(average_efficiency, 2),
+                    'daily_efficiency': daily_efficiency
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting efficiency trends: {str(e)}")
+            raise
+
+    def record_production_data(self, line_id: int, data: Dict) -> bool:
+        """Record production data for a production line"""
+        try:
+            if not self.validator.validate_production_data(data):
+                raise ValueError("Invalid production data")
+
+            with get_db_session() as session:
+                line = session.query(ProductionLine).filter(
+                    ProductionLine.id == line_id
+                ).first()
+
+                if not line:
+                    raise ValueError(f"Production line {line_id} not found")
+
+                # Calculate efficiency for this record
+                planned = data.get('planned_quantity', 0)
+                actual = data.get('actual_quantity', 0)
+                efficiency = (actual / planned) if planned > 0 else 0
+
+                # Create production record
+                record = ProductionRecord(
+                    production_line_id=line_id,
+                    product_id=data.get('product_id', 'UNKNOWN'),
+                    shift_id=data.get('shift_id'),
+                    planned_quantity=planned,
+                    actual_quantity=actual,
+                    defective_quantity=data.get('defective_quantity', 0),
+                    start_time=data.get('start_time'),
+                    end_time=data.get('end_time'),
+                    efficiency=efficiency,
+                    downtime_minutes=data.get('downtime_minutes', 0),
+                    downtime_reason=data.get('downtime_reason'),
+                    quality_score=data.get('quality_score', 0.0)
+                )
+                session.add(record)
+                session.flush()
+
+                # Record materials used if provided
+                for material in data.get('materials_used', []):
+                    production_item = ProductionItem(
+                        production_record_id=record.id,
+                        inventory_item_id=material['inventory_item_id'],
+                        planned_quantity=material.get('planned_quantity', 0),
+                        actual_quantity=material.get('actual_quantity', 0),
+                        waste_quantity=material.get('waste_quantity', 0)
+                    )
+                    session.add(production_item)
+
+                # Check if performance alert needed
+                self._check_efficiency_alert(session, line, efficiency)
+
+                session.commit()
+                logger.info(f"Production data recorded for line {line_id}")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error recording production data for line {line_id}: {str(e)}")
+            raise
+
+    def _calculate_line_metrics(self, session, line: ProductionLine) -> Dict:
+        """Calculate current metrics for a production line"""
+        # Get today's production records
+        start_of_day = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        records = session.query(ProductionRecord).filter(
+            ProductionRecord.production_line_id == line.id,
+            ProductionRecord.created_at >= start_of_day
+        ).all()
+
+        daily_production = sum(r.actual_quantity for r in records)
+        downtime_minutes = sum(r.downtime_minutes for r in records)
+
+        total_planned = sum(r.planned_quantity for r in records)
+        efficiency = (daily_production / total_planned * 100) if total_planned > 0 else 0
+
+        # Determine line status
+        if not records:
+            status = 'IDLE'
+        elif efficiency >= line.efficiency_target * 100:
+            status = 'RUNNING'
+        elif efficiency >= self.alert_threshold * 100:
+            status = 'UNDERPERFORMING'
+        else:
+            status = 'CRITICAL'
+
+        return {
+            'status': status,
+            'efficiency': round(efficiency, 2),
+            'daily_production': daily_production,
+            'downtime_minutes': downtime_minutes
+        }
+
+    def _check_line_performance(self):
+        """Check performance of all active lines and raise alerts"""
+        try:
+            with get_db_session() as session:
+                lines = session.query(ProductionLine).filter(
+                    ProductionLine.is_active == True
+                ).all()
+
+                for line in lines:
+                    metrics = self._calculate_line_metrics(session, line)
+                    if metrics['status'] == 'CRITICAL':
+                        self._check_efficiency_alert(
+                            session, line, metrics['efficiency'] / 100
+                        )
+
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Error checking line performance: {str(e)}")
+
+    def _check_efficiency_alert(self, session, line: ProductionLine, efficiency: float):
+        """Create production alert if efficiency is below threshold"""
+        try:
+            if efficiency >= self.alert_threshold:
+                return
+
+            # Check if alert already exists
+            existing_alert = session.query(Alert).filter(
+                Alert.source_id == str(line.id),
+                Alert.source_type == 'PRODUCTION',
+                Alert.alert_type == 'PRODUCTION_ISSUE',
+                Alert.is_resolved == False
+            ).first()
+
+            if not existing_alert:
+                alert = Alert(
+                    alert_type='PRODUCTION_ISSUE',
+                    severity='HIGH' if efficiency < self.alert_threshold * 0.5 else 'MEDIUM',
+                    title=f"Low Efficiency Alert: {line.name}",
+                    message=f"Line efficiency ({efficiency*100:.1f}%) is below threshold ({self.alert_threshold*100:.1f}%)",
+                    source_id=str(line.id),
+                    source_type='PRODUCTION'
+                )
+                session.add(alert)
+
+        except Exception as e:
+            logger.error(f"Error checking efficiency alerts for line {line.id}: {str(e)}")
@@ -25,10 +25,25 @@ Author: Hilmi Iliass
 Date: March 2022 - June 2022
 """
 
-from .data_validator import DataValidator
+from .data_validator import (
+    DataValidator, DEFAULT_VALIDATOR,
+    validate_inventory_item, validate_stock_movement, validate_production_data,
+    validate_supplier_data, validate_production_line_data, validate_alert_data,
+    validate_date_range, sanitize_string, validate_numeric_range,
+)
 
 __all__ = [
     'DataValidator',
+    'DEFAULT_VALIDATOR',
+    'validate_inventory_item',
+    'validate_stock_movement',
+    'validate_production_data',
+    'validate_supplier_data',
+    'validate_production_line_data',
+    'validate_alert_data',
+    'validate_date_range',
+    'sanitize_string',
+    'validate_numeric_range',
 ]
 
 # Package metadata
@@ -37,9 +52,9 @@ __description__ = "Utility functions and helpers for the ADIENT Inventory Manage
 
 # Validation constants
 VALIDATION_PATTERNS = {
-    'PART_NUMBER': r'^[A-Z0-9\-]{3,20},
-    'EMAIL': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,},
-    'PHONE': r'^[\+]?[1-9][\d]{0,15}
+    'PART_NUMBER': r'^[A-Z0-9\-]{3,20}$',
+    'EMAIL': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+    'PHONE': r'^[\+]?[1-9][\d]{0,15}$'
 }
 
 # Data type ranges
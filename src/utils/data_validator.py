@@ -5,343 +5,635 @@ Provides validation functions for various data inputs
 
 import logging
 import re
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import re2 as _regex
+    RE2_AVAILABLE = True
+except ImportError:
+    _regex = re
+    RE2_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+def _check_production_rows_loop(planned, actual, defective, downtime, quality):
+    n = len(actual)
+    out = np.ones(n, dtype=np.bool_)
+    for i in range(n):
+        if (planned[i] < 0 or actual[i] < 0 or defective[i] < 0
+                or defective[i] > actual[i] or downtime[i] < 0
+                or quality[i] < 0 or quality[i] > 100):
+            out[i] = False
+    return out
+
+if NUMBA_AVAILABLE:
+    # cache=True keeps the compiled kernel across processes, avoiding the
+    # first-call JIT cost on every import
+    _check_production_rows = njit(cache=True)(_check_production_rows_loop)
+else:
+    def _check_production_rows(planned, actual, defective, downtime, quality):
+        """Fused numeric checks for production rows (valid-row mask)
+
+        NaN entries pass, matching the optional-field semantics of the
+        per-rule batch checks.
+        """
+        ok = ~((planned < 0) | (actual < 0) | (defective < 0)
+               | (defective > actual) | (downtime < 0)
+               | (quality < 0) | (quality > 100))
+        return ok
+
+# Compiled once per process and shared by all DataValidator instances.
+# With google-re2 installed these match in linear time (no backtracking);
+# otherwise the stdlib engine is used.
+_PART_NUMBER_RE = _regex.compile(r'^[A-Z0-9\-]{3,20}$')
+_EMAIL_RE = _regex.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = _regex.compile(r'^[\+]?[1-9][\d]{0,15}$')
+# Bound match methods: hot loops call these without re-resolving the
+# attribute on every row
+_PART_NUMBER_MATCH = _PART_NUMBER_RE.match
+_EMAIL_MATCH = _EMAIL_RE.match
+_PHONE_MATCH = _PHONE_RE.match
+
+# Deletion table for phone separators; one translate pass beats a
+# regex substitution and is a no-op allocation-wise on clean numbers.
+# Covers the full \s class the regex it replaced used to strip.
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' \t\n\r\f\v-()')
+
+# Deletion table for sanitize_string; translate is a single C loop with
+# no regex engine state
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'')
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' suffix
+
+    Cached because bulk imports repeat the same shift timestamps many
+    times over.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Far-future cutoff for validate_date_range, refreshed at most hourly so
+# loops over date-range filters don't allocate two datetimes per call
+_FUTURE_CUTOFF_TTL = 3600
+_future_cutoff = [datetime.utcnow() + timedelta(days=365), time.monotonic()]
+
+def _max_future_date() -> datetime:
+    """Cached 'one year from now' bound with a lazy hourly refresh"""
+    if time.monotonic() - _future_cutoff[1] > _FUTURE_CUTOFF_TTL:
+        _future_cutoff[0] = datetime.utcnow() + timedelta(days=365)
+        _future_cutoff[1] = time.monotonic()
+    return _future_cutoff[0]
+
+
+def _hashable_key(data: Dict) -> Optional[tuple]:
+    """Content key for a flat data dict, or None if any value is unhashable"""
+    try:
+        key = tuple(sorted(data.items()))
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
+_VALID_UNITS = frozenset({'pieces', 'kg', 'liters', 'meters', 'boxes', 'rolls'})
+
+# Interned enum constants: callers usually pass literals (which CPython
+# interns already), so membership tests hit cached hashes and the
+# movement checks below reduce to pointer compares
+_IN = sys.intern('IN')
+_OUT = sys.intern('OUT')
+_ADJUSTMENT = sys.intern('ADJUSTMENT')
+_VALID_MOVEMENT_TYPES = frozenset({_IN, _OUT, _ADJUSTMENT})
+_VALID_SEVERITIES = frozenset({sys.intern('LOW'), sys.intern('MEDIUM'),
+                               sys.intern('HIGH'), sys.intern('CRITICAL')})
+_VALID_ALERT_TYPES = frozenset({'LOW_STOCK', 'PRODUCTION_ISSUE', 'MAINTENANCE',
+                                'QUALITY', 'SYSTEM'})
+_VALID_SOURCE_TYPES = frozenset({'INVENTORY', 'PRODUCTION', 'SYSTEM'})
+
+# Declarative field schemas: (field, types, min, max, required).
+# min/max bound the length for strings and the value for numbers.
+_INVENTORY_SCHEMA = (
+    ('part_number', str, 1, 50, True),
+    ('name', str, 3, 200, True),
+    ('unit_cost', (int, float), 0, None, True),
+    ('current_stock', int, 0, None, False),
+    ('minimum_stock', int, 0, None, False),
+    ('maximum_stock', int, 0, None, False),
+    ('reorder_point', int, 0, None, False),
+    ('reorder_quantity', int, 0, None, False),
+    ('category', str, None, 100, False),
+)
+
+_SUPPLIER_SCHEMA = (
+    ('name', str, 2, 200, True),
+    ('email', str, None, None, False),
+    ('phone', str, None, None, False),
+    ('lead_time_days', int, 0, None, False),
+)
+
+_PRODUCTION_LINE_SCHEMA = (
+    ('name', str, 3, 100, True),
+    ('capacity_per_hour', int, 1, None, True),
+    ('efficiency_target', (int, float), 0, 1, False),
+)
+
+_ALERT_SCHEMA = (
+    ('alert_type', str, 1, 50, True),
+    ('title', str, 1, 200, True),
+    ('message', str, 1, 1000, True),
+)
+
+def _build_inventory_validator():
+    """Generate a fused validator function from _INVENTORY_SCHEMA
+
+    The schema is fixed at import time, so the generic _check_schema
+    loop is unrolled here into straight-line code: each field is pulled
+    into a local exactly once and every bound is a literal comparison.
+    The generated function is compiled once per process.
+    """
+    lines = ['def _validate(data):']
+    for i, (field, types, min_val, max_val, required) in enumerate(_INVENTORY_SCHEMA):
+        var = f'v{i}'
+        lines.append(f'    {var} = data.get({field!r})')
+        if required:
+            lines.append(f'    if {var} is None:')
+            lines.append(f'        logger.error("Missing required field: {field}")')
+            lines.append('        return False')
+            indent = '    '
+        else:
+            lines.append(f'    if {var} is not None:')
+            indent = '        '
+        if types is int:
+            type_check = f'type({var}) is not int'
+        elif isinstance(types, tuple):
+            names = ', '.join(t.__name__ for t in types)
+            type_check = f'not isinstance({var}, ({names}))'
+        else:
+            type_check = f'not isinstance({var}, {types.__name__})'
+        measure = f'len({var})' if types is str else var
+        checks = [type_check]
+        if min_val is not None:
+            checks.append(f'{measure} < {min_val!r}')
+        if max_val is not None:
+            checks.append(f'{measure} > {max_val!r}')
+        lines.append(f'{indent}if {" or ".join(checks)}:')
+        lines.append(f'{indent}    logger.error("Invalid %s: %s", {field!r}, {var})')
+        lines.append(f'{indent}    return False')
+    lines.append('    if _PART_NUMBER_MATCH(v0) is None:')
+    lines.append('        logger.error("Invalid part number format: %s", v0)')
+    lines.append('        return False')
+    lines.append("    uom = data.get('unit_of_measure')")
+    lines.append('    if uom and uom not in _VALID_UNITS:')
+    lines.append('        logger.warning("Non-standard unit of measure: %s", uom)')
+    lines.append('    return True')
+
+    namespace = {'logger': logger, '_PART_NUMBER_MATCH': _PART_NUMBER_MATCH,
+                 '_VALID_UNITS': _VALID_UNITS}
+    exec(compile('\n'.join(lines), '<inventory validator>', 'exec'), namespace)
+    return namespace['_validate']
+
+_INVENTORY_FAST = _build_inventory_validator()
+
 class DataValidator:
-    """Data validation utility class"""
-    
-    def __init__(self):
-        """Initialize data validator"""
-        self.part_number_pattern = re.compile(r'^[A-Z0-9\-]{3,20}$')
-        self.email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        self.phone_pattern = re.compile(r'^[\+]?[1-9][\d]{0,15}$')
-        
-    def validate_inventory_item(self, data: Dict) -> bool:
-        """Validate inventory item data"""
-        try:
-            required_fields = ['part_number', 'name', 'unit_cost']
-            
-            # Check required fields
-            for field in required_fields:
-                if field not in data or data[field] is None:
-                    logger.error(f"Missing required field: {field}")
+    """Data validation utility class
+
+    Holds no per-instance state: every method is a staticmethod and the
+    compiled patterns live at module level, so DataValidator() costs
+    nothing and calls skip bound-method creation.
+    """
+
+    # Aliases for callers that read the compiled patterns off an instance
+    part_number_pattern = _PART_NUMBER_RE
+    email_pattern = _EMAIL_RE
+    phone_pattern = _PHONE_RE
+
+    @staticmethod
+    def _check_schema(data: Dict, schema) -> bool:
+        """Validate fields of a data dict against a declarative schema
+
+        Each schema row is (field, types, min, max, required); min/max
+        bound the length for strings and the value for numbers. Returns
+        False on the first failing field, matching the hand-written
+        validators it replaces.
+        """
+        for field, types, min_val, max_val, required in schema:
+            val = data.get(field)
+            if val is None:
+                if required:
+                    logger.error("Missing required field: %s", field)
                     return False
-            
-            # Validate part number format
-            if not self.part_number_pattern.match(data['part_number']):
-                logger.error(f"Invalid part number format: {data['part_number']}")
+                continue
+            if types is int:
+                # Exact type check: bool is an int subclass and must not
+                # slip through integer quantity fields
+                if type(val) is not int:
+                    logger.error("Invalid %s: %s", field, val)
+                    return False
+            elif not isinstance(val, types):
+                logger.error("Invalid %s: %s", field, val)
                 return False
-            
-            # Validate name length
-            if len(data['name']) < 3 or len(data['name']) > 200:
-                logger.error(f"Invalid name length: {len(data['name'])}")
+            measure = len(val) if isinstance(val, str) else val
+            if min_val is not None and measure < min_val:
+                logger.error("Invalid %s: %s", field, val)
                 return False
-            
-            # Validate unit cost
-            if not isinstance(data['unit_cost'], (int, float)) or data['unit_cost'] < 0:
-                logger.error(f"Invalid unit cost: {data['unit_cost']}")
+            if max_val is not None and measure > max_val:
+                logger.error("Invalid %s: %s", field, val)
                 return False
-            
-            # Validate stock quantities if provided
-            stock_fields = ['current_stock', 'minimum_stock', 'maximum_stock', 'reorder_point', 'reorder_quantity']
-            for field in stock_fields:
-                if field in data and data[field] is not None:
-                    if not isinstance(data[field], int) or data[field] < 0:
-                        logger.error(f"Invalid {field}: {data[field]}")
-                        return False
-            
-            # Validate category if provided
-            if 'category' in data and data['category']:
-                if len(data['category']) > 100:
-                    logger.error(f"Category too long: {len(data['category'])}")
-                    return False
-            
-            # Validate unit of measure if provided
-            if 'unit_of_measure' in data and data['unit_of_measure']:
-                valid_units = ['pieces', 'kg', 'liters', 'meters', 'boxes', 'rolls']
-                if data['unit_of_measure'] not in valid_units:
-                    logger.warning(f"Non-standard unit of measure: {data['unit_of_measure']}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating inventory item: {str(e)}")
-            return False
+        return True
+
+    @staticmethod
+    def validate_inventory_item(data: Dict) -> bool:
+        """Validate inventory item data
+
+        Identical payloads (periodic re-syncs) are answered from a
+        content-keyed cache; log output is only emitted on the first
+        sighting of a given payload.
+        """
+        key = _hashable_key(data)
+        if key is not None:
+            return _validate_inventory_cached(key)
+        return DataValidator._validate_inventory_item(data)
+
+    @staticmethod
+    def _validate_inventory_item(data: Dict) -> bool:
+        # Fused function generated from _INVENTORY_SCHEMA at import
+        return _INVENTORY_FAST(data)
     
-    def validate_stock_movement(self, quantity: int, movement_type: str) -> bool:
+    @staticmethod
+    def validate_inventory_items_batch(df) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Validate a DataFrame of inventory items using columnar checks
+
+        Returns a boolean mask of valid rows plus per-rule failure counts.
+        Much faster than looping validate_inventory_item for bulk imports.
+        """
+        if not PANDAS_AVAILABLE:
+            raise RuntimeError("pandas is required for batch validation")
+
+        mask = np.ones(len(df), dtype=bool)
+        failures = {}
+
+        rules = [
+            ('part_number_missing', df['part_number'].notna()),
+            ('part_number_format',
+             df['part_number'].fillna('').astype(str).str.match(_PART_NUMBER_RE.pattern)),
+            ('name_length', df['name'].fillna('').astype(str).str.len().between(3, 200)),
+            ('unit_cost_invalid',
+             pd.to_numeric(df['unit_cost'], errors='coerce').ge(0)),
+        ]
+
+        stock_fields = ['current_stock', 'minimum_stock', 'maximum_stock',
+                        'reorder_point', 'reorder_quantity']
+        for field in stock_fields:
+            if field in df.columns:
+                values = pd.to_numeric(df[field], errors='coerce')
+                # Optional fields: missing values are fine, negatives are not
+                rules.append((f'{field}_invalid', values.isna() | values.ge(0)))
+
+        for rule_name, rule_mask in rules:
+            rule_mask = np.asarray(rule_mask, dtype=bool)
+            failed = int((~rule_mask & mask).sum())
+            if failed:
+                failures[rule_name] = failed
+            mask &= rule_mask
+
+        if failures:
+            logger.warning("Batch inventory validation failures: %s", failures)
+        return mask, failures
+
+    @staticmethod
+    def validate_inventory_columns(part_numbers, names, costs, stocks=None) -> np.ndarray:
+        """Validate parallel inventory columns without a DataFrame
+
+        Bulk-ingest entry point for callers holding raw columns: the
+        numeric checks are vectorized and the string loop runs against
+        bound match/len with no per-row attribute resolution. Returns
+        the valid-row mask.
+        """
+        costs = np.asarray(costs, dtype=np.float64)
+        mask = ~np.isnan(costs) & (costs >= 0)
+        if stocks is not None:
+            stock_values = np.asarray(stocks, dtype=np.float64)
+            mask &= np.isnan(stock_values) | (stock_values >= 0)
+        match = _PART_NUMBER_MATCH
+        for i, (part_number, name) in enumerate(zip(part_numbers, names)):
+            if mask[i] and (not isinstance(part_number, str)
+                            or match(part_number) is None
+                            or not isinstance(name, str)
+                            or not 3 <= len(name) <= 200):
+                mask[i] = False
+        return mask
+
+    @staticmethod
+    def validate_production_data_batch(df) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Validate a DataFrame of production records using columnar checks
+
+        Returns a boolean mask of valid rows plus per-rule failure counts.
+        """
+        if not PANDAS_AVAILABLE:
+            raise RuntimeError("pandas is required for batch validation")
+
+        mask = np.ones(len(df), dtype=bool)
+        failures = {}
+        rules = []
+
+        # Fast path: when every numeric column is present, one fused kernel
+        # pass decides the (common) all-valid case without building the
+        # per-rule masks
+        numeric_cols = ('planned_quantity', 'actual_quantity', 'defective_quantity',
+                        'downtime_minutes', 'quality_score')
+        if all(col in df.columns for col in numeric_cols):
+            columns = [pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+                       for col in numeric_cols]
+            if _check_production_rows(*columns).all():
+                return mask, failures
+
+        quantity_fields = ['planned_quantity', 'actual_quantity', 'defective_quantity',
+                           'downtime_minutes']
+        for field in quantity_fields:
+            if field in df.columns:
+                values = pd.to_numeric(df[field], errors='coerce')
+                rules.append((f'{field}_invalid', values.isna() | values.ge(0)))
+
+        if 'defective_quantity' in df.columns and 'actual_quantity' in df.columns:
+            defective = pd.to_numeric(df['defective_quantity'], errors='coerce')
+            actual = pd.to_numeric(df['actual_quantity'], errors='coerce')
+            rules.append(('defective_exceeds_actual',
+                          defective.isna() | actual.isna() | defective.le(actual)))
+
+        if 'quality_score' in df.columns:
+            quality = pd.to_numeric(df['quality_score'], errors='coerce')
+            rules.append(('quality_score_invalid',
+                          quality.isna() | quality.between(0, 100)))
+
+        for rule_name, rule_mask in rules:
+            rule_mask = np.asarray(rule_mask, dtype=bool)
+            failed = int((~rule_mask & mask).sum())
+            if failed:
+                failures[rule_name] = failed
+            mask &= rule_mask
+
+        if failures:
+            logger.warning("Batch production validation failures: %s", failures)
+        return mask, failures
+
+    @staticmethod
+    def validate_stock_movement(quantity: int, movement_type: str) -> bool:
         """Validate stock movement data"""
-        try:
-            # Validate quantity
-            if not isinstance(quantity, int):
-                logger.error(f"Invalid quantity type: {type(quantity)}")
-                return False
-            
-            # For adjustment movements, quantity can be any non-negative value
-            # For IN/OUT movements, quantity must be positive
-            if movement_type in ['IN', 'OUT'] and quantity <= 0:
-                logger.error(f"Invalid quantity for {movement_type} movement: {quantity}")
-                return False
-            
-            if movement_type == 'ADJUSTMENT' and quantity < 0:
-                logger.error(f"Invalid quantity for adjustment: {quantity}")
-                return False
-            
-            # Validate movement type
-            valid_types = ['IN', 'OUT', 'ADJUSTMENT']
-            if movement_type not in valid_types:
-                logger.error(f"Invalid movement type: {movement_type}")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating stock movement: {str(e)}")
+        # Validate quantity (exact type: bools must not pass as ints)
+        if type(quantity) is not int:
+            logger.error("Invalid quantity type: %s", type(quantity))
             return False
+
+        if isinstance(movement_type, str):
+            movement_type = sys.intern(movement_type)
+        else:
+            # Unhashable values must return False, not raise from the
+            # frozenset membership test below
+            logger.error("Invalid movement type: %s", movement_type)
+            return False
+
+        # For adjustment movements, quantity can be any non-negative value
+        # For IN/OUT movements, quantity must be positive
+        if (movement_type is _IN or movement_type is _OUT) and quantity <= 0:
+            logger.error("Invalid quantity for %s movement: %s", movement_type, quantity)
+            return False
+
+        if movement_type is _ADJUSTMENT and quantity < 0:
+            logger.error("Invalid quantity for adjustment: %s", quantity)
+            return False
+
+        # Validate movement type
+        if movement_type not in _VALID_MOVEMENT_TYPES:
+            logger.error("Invalid movement type: %s", movement_type)
+            return False
+
+        return True
     
-    def validate_production_data(self, data: Dict) -> bool:
+    @staticmethod
+    def validate_production_data(data: Dict) -> bool:
         """Validate production record data"""
-        try:
-            # Validate quantities
-            quantity_fields = ['planned_quantity', 'actual_quantity', 'defective_quantity']
-            for field in quantity_fields:
-                if field in data and data[field] is not None:
-                    if not isinstance(data[field], int) or data[field] < 0:
-                        logger.error(f"Invalid {field}: {data[field]}")
-                        return False
-            
-            # Validate defective quantity doesn't exceed actual quantity
-            if ('defective_quantity' in data and 'actual_quantity' in data and 
-                data['defective_quantity'] is not None and data['actual_quantity'] is not None):
-                if data['defective_quantity'] > data['actual_quantity']:
-                    logger.error("Defective quantity cannot exceed actual quantity")
-                    return False
-            
-            # Validate downtime minutes
-            if 'downtime_minutes' in data and data['downtime_minutes'] is not None:
-                if not isinstance(data['downtime_minutes'], int) or data['downtime_minutes'] < 0:
-                    logger.error(f"Invalid downtime minutes: {data['downtime_minutes']}")
-                    return False
-            
-            # Validate quality score
-            if 'quality_score' in data and data['quality_score'] is not None:
-                if not isinstance(data['quality_score'], (int, float)) or not (0 <= data['quality_score'] <= 100):
-                    logger.error(f"Invalid quality score: {data['quality_score']}")
-                    return False
-            
-            # Validate timestamps
-            time_fields = ['start_time', 'end_time']
-            for field in time_fields:
-                if field in data and data[field] is not None:
-                    if not isinstance(data[field], datetime):
-                        try:
-                            # Try to parse as ISO string
-                            datetime.fromisoformat(data[field].replace('Z', '+00:00'))
-                        except (ValueError, AttributeError):
-                            logger.error(f"Invalid {field} format: {data[field]}")
-                            return False
-            
-            # Validate start_time <= end_time if both provided
-            if ('start_time' in data and 'end_time' in data and 
-                data['start_time'] is not None and data['end_time'] is not None):
-                start_time = data['start_time']
-                end_time = data['end_time']
-                
-                if isinstance(start_time, str):
-                    start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                if isinstance(end_time, str):
-                    end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                
-                if start_time > end_time:
-                    logger.error("Start time cannot be after end time")
-                    return False
-            
-            # Validate product_id if provided
-            if 'product_id' in data and data['product_id']:
-                if not isinstance(data['product_id'], str) or len(data['product_id']) > 50:
-                    logger.error(f"Invalid product_id: {data['product_id']}")
-                    return False
-            
-            # Validate shift_id if provided
-            if 'shift_id' in data and data['shift_id']:
-                if not isinstance(data['shift_id'], str) or len(data['shift_id']) > 20:
-                    logger.error(f"Invalid shift_id: {data['shift_id']}")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating production data: {str(e)}")
+        # Validate quantities (each field fetched once into a local)
+        for field in ('planned_quantity', 'actual_quantity', 'defective_quantity'):
+            value = data.get(field)
+            if value is not None and (type(value) is not int or value < 0):
+                logger.error("Invalid %s: %s", field, value)
+                return False
+
+        # Validate defective quantity doesn't exceed actual quantity
+        defective = data.get('defective_quantity')
+        actual = data.get('actual_quantity')
+        if defective is not None and actual is not None and defective > actual:
+            logger.error("Defective quantity cannot exceed actual quantity")
             return False
-    
-    def validate_supplier_data(self, data: Dict) -> bool:
-        """Validate supplier data"""
-        try:
-            # Check required fields
-            if 'name' not in data or not data['name']:
-                logger.error("Supplier name is required")
+
+        # Validate downtime minutes
+        downtime = data.get('downtime_minutes')
+        if downtime is not None and (type(downtime) is not int or downtime < 0):
+            logger.error("Invalid downtime minutes: %s", downtime)
+            return False
+
+        # Validate quality score
+        quality = data.get('quality_score')
+        if quality is not None and (not isinstance(quality, (int, float))
+                                    or not 0 <= quality <= 100):
+            logger.error("Invalid quality score: %s", quality)
+            return False
+
+        # Validate timestamps: parse each value once into a local, then
+        # compare the locals; only the parse and the mixed naive/aware
+        # comparison can raise
+        start_dt = data.get('start_time')
+        if start_dt is not None and not isinstance(start_dt, datetime):
+            try:
+                start_dt = _parse_iso(start_dt)
+            except (ValueError, TypeError, AttributeError):
+                logger.error("Invalid start_time format: %s", data['start_time'])
                 return False
-            
-            # Validate name length
-            if len(data['name']) < 2 or len(data['name']) > 200:
-                logger.error(f"Invalid supplier name length: {len(data['name'])}")
+
+        end_dt = data.get('end_time')
+        if end_dt is not None and not isinstance(end_dt, datetime):
+            try:
+                end_dt = _parse_iso(end_dt)
+            except (ValueError, TypeError, AttributeError):
+                logger.error("Invalid end_time format: %s", data['end_time'])
                 return False
-            
-            # Validate email if provided
-            if 'email' in data and data['email']:
-                if not self.email_pattern.match(data['email']):
-                    logger.error(f"Invalid email format: {data['email']}")
-                    return False
-            
-            # Validate phone if provided
-            if 'phone' in data and data['phone']:
-                # Remove common formatting characters
-                clean_phone = re.sub(r'[\s\-\(\)]', '', data['phone'])
-                if not self.phone_pattern.match(clean_phone):
-                    logger.error(f"Invalid phone format: {data['phone']}")
-                    return False
-            
-            # Validate lead time
-            if 'lead_time_days' in data and data['lead_time_days'] is not None:
-                if not isinstance(data['lead_time_days'], int) or data['lead_time_days'] < 0:
-                    logger.error(f"Invalid lead time: {data['lead_time_days']}")
+
+        # Validate start_time <= end_time if both provided
+        if start_dt is not None and end_dt is not None:
+            try:
+                if start_dt > end_dt:
+                    logger.error("Start time cannot be after end time")
                     return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating supplier data: {str(e)}")
+            except TypeError:
+                logger.error("Incomparable start/end times: %s / %s",
+                             data['start_time'], data['end_time'])
+                return False
+
+        # Validate product_id if provided
+        product_id = data.get('product_id')
+        if product_id and (not isinstance(product_id, str) or len(product_id) > 50):
+            logger.error("Invalid product_id: %s", product_id)
             return False
+
+        # Validate shift_id if provided
+        shift_id = data.get('shift_id')
+        if shift_id and (not isinstance(shift_id, str) or len(shift_id) > 20):
+            logger.error("Invalid shift_id: %s", shift_id)
+            return False
+
+        return True
     
-    def validate_production_line_data(self, data: Dict) -> bool:
-        """Validate production line data"""
-        try:
-            # Check required fields
-            required_fields = ['name', 'capacity_per_hour']
-            for field in required_fields:
-                if field not in data or data[field] is None:
-                    logger.error(f"Missing required field: {field}")
-                    return False
-            
-            # Validate name
-            if len(data['name']) < 3 or len(data['name']) > 100:
-                logger.error(f"Invalid name length: {len(data['name'])}")
-                return False
-            
-            # Validate capacity
-            if not isinstance(data['capacity_per_hour'], int) or data['capacity_per_hour'] <= 0:
-                logger.error(f"Invalid capacity: {data['capacity_per_hour']}")
-                return False
-            
-            # Validate efficiency target if provided
-            if 'efficiency_target' in data and data['efficiency_target'] is not None:
-                if not isinstance(data['efficiency_target'], (int, float)) or not (0 <= data['efficiency_target'] <= 1):
-                    logger.error(f"Invalid efficiency target: {data['efficiency_target']}")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating production line data: {str(e)}")
+    @staticmethod
+    def validate_supplier_data(data: Dict) -> bool:
+        """Validate supplier data
+
+        Results for identical payloads are served from a content-keyed
+        cache, as with validate_inventory_item.
+        """
+        key = _hashable_key(data)
+        if key is not None:
+            return _validate_supplier_cached(key)
+        return DataValidator._validate_supplier_data(data)
+
+    @staticmethod
+    def _validate_supplier_data(data: Dict) -> bool:
+        if not DataValidator._check_schema(data, _SUPPLIER_SCHEMA):
+            return False
+
+        # Validate email if provided
+        email = data.get('email')
+        if email and _EMAIL_MATCH(email) is None:
+            logger.error("Invalid email format: %s", email)
             return False
+
+        # Validate phone if provided
+        phone = data.get('phone')
+        if phone:
+            # Remove common formatting characters
+            if _PHONE_MATCH(phone.translate(_PHONE_STRIP_TABLE)) is None:
+                logger.error("Invalid phone format: %s", phone)
+                return False
+
+        return True
+    
+    @staticmethod
+    def validate_production_line_data(data: Dict) -> bool:
+        """Validate production line data"""
+        return DataValidator._check_schema(data, _PRODUCTION_LINE_SCHEMA)
     
-    def validate_alert_data(self, data: Dict) -> bool:
+    @staticmethod
+    def validate_alert_data(data: Dict) -> bool:
         """Validate alert data"""
-        try:
-            # Check required fields
-            required_fields = ['alert_type', 'title', 'message']
-            for field in required_fields:
-                if field not in data or not data[field]:
-                    logger.error(f"Missing required field: {field}")
-                    return False
-            
-            # Validate alert type
-            valid_types = ['LOW_STOCK', 'PRODUCTION_ISSUE', 'MAINTENANCE', 'QUALITY', 'SYSTEM']
-            if data['alert_type'] not in valid_types:
-                logger.error(f"Invalid alert type: {data['alert_type']}")
-                return False
-            
-            # Validate severity
-            if 'severity' in data and data['severity']:
-                valid_severities = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
-                if data['severity'] not in valid_severities:
-                    logger.error(f"Invalid severity: {data['severity']}")
-                    return False
-            
-            # Validate title length
-            if len(data['title']) > 200:
-                logger.error(f"Title too long: {len(data['title'])}")
-                return False
-            
-            # Validate message length
-            if len(data['message']) > 1000:
-                logger.error(f"Message too long: {len(data['message'])}")
-                return False
-            
-            # Validate source type if provided
-            if 'source_type' in data and data['source_type']:
-                valid_sources = ['INVENTORY', 'PRODUCTION', 'SYSTEM']
-                if data['source_type'] not in valid_sources:
-                    logger.error(f"Invalid source type: {data['source_type']}")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating alert data: {str(e)}")
+        if not DataValidator._check_schema(data, _ALERT_SCHEMA):
             return False
+
+        # Validate alert type
+        alert_type = data.get('alert_type')
+        if alert_type not in _VALID_ALERT_TYPES:
+            logger.error("Invalid alert type: %s", alert_type)
+            return False
+
+        # Validate severity (str check first: unhashable values must
+        # fail cleanly, not raise from the membership test)
+        severity = data.get('severity')
+        if severity and (not isinstance(severity, str)
+                         or severity not in _VALID_SEVERITIES):
+            logger.error("Invalid severity: %s", severity)
+            return False
+
+        # Validate source type if provided
+        source_type = data.get('source_type')
+        if source_type and (not isinstance(source_type, str)
+                            or source_type not in _VALID_SOURCE_TYPES):
+            logger.error("Invalid source type: %s", source_type)
+            return False
+
+        return True
     
-    def validate_date_range(self, start_date: Any, end_date: Any) -> bool:
+    @staticmethod
+    def validate_date_range(start_date: Any, end_date: Any) -> bool:
         """Validate date range"""
+        # Convert strings to datetime if needed; only the parse can raise
         try:
-            # Convert strings to datetime if needed
             if isinstance(start_date, str):
-                start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                start_date = _parse_iso(start_date)
             if isinstance(end_date, str):
-                end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-            
-            # Check if both are datetime objects
-            if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
-                logger.error("Invalid date format")
-                return False
-            
-            # Check if start_date <= end_date
+                end_date = _parse_iso(end_date)
+        except ValueError:
+            logger.error("Invalid date format")
+            return False
+
+        # Check if both are datetime objects
+        if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
+            logger.error("Invalid date format")
+            return False
+
+        # Order and future-bound checks; only the mixed naive/aware
+        # comparison can raise, matching validate_production_data
+        try:
             if start_date > end_date:
                 logger.error("Start date cannot be after end date")
                 return False
-            
+
             # Check if dates are not too far in the future
-            now = datetime.utcnow()
-            if start_date > now + timedelta(days=365):
+            if start_date > _max_future_date():
                 logger.error("Start date too far in the future")
                 return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating date range: {str(e)}")
+        except TypeError:
+            logger.error("Incomparable dates: %s / %s", start_date, end_date)
             return False
+
+        return True
     
-    def sanitize_string(self, value: str, max_length: int = None) -> str:
+    @staticmethod
+    def sanitize_string(value: str, max_length: int = None) -> str:
         """Sanitize string input"""
         if not isinstance(value, str):
             return str(value)
         
-        # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\']', '', value)
-        
-        # Trim whitespace
-        sanitized = sanitized.strip()
-        
+        # Remove potentially dangerous characters and trim whitespace
+        sanitized = value.translate(_SANITIZE_TABLE).strip()
+
         # Apply length limit if specified
-        if max_length and len(sanitized) > max_length:
-            sanitized = sanitized[:max_length]
-        
-        return sanitized
+        return sanitized[:max_length] if max_length else sanitized
     
-    def validate_numeric_range(self, value: Any, min_val: float = None, max_val: float = None) -> bool:
+    @staticmethod
+    def validate_numeric_range_array(values, min_val: float = None,
+                                     max_val: float = None) -> np.ndarray:
+        """Validate an array of numeric values within range
+
+        Vectorized companion to validate_numeric_range for telemetry
+        arrays; returns a boolean mask of in-range values.
+        """
+        arr = np.asarray(values, dtype=np.float64)
+        mask = ~np.isnan(arr)
+        if min_val is not None:
+            mask &= (arr >= min_val)
+        if max_val is not None:
+            mask &= (arr <= max_val)
+        return mask
+
+    @staticmethod
+    def validate_numeric_range(value: Any, min_val: float = None, max_val: float = None) -> bool:
         """Validate numeric value within range"""
         try:
             if not isinstance(value, (int, float)):
@@ -356,5 +648,32 @@ class DataValidator:
             return True
             
         except Exception as e:
-            logger.error(f"Error validating numeric range: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error("Error validating numeric range: %s", str(e))
+            return False
+
+# Memoized entry points: validation is a pure function of the payload,
+# so identical dicts can be answered from cache
+@lru_cache(maxsize=8192)
+def _validate_inventory_cached(key: tuple) -> bool:
+    return DataValidator._validate_inventory_item(dict(key))
+
+@lru_cache(maxsize=8192)
+def _validate_supplier_cached(key: tuple) -> bool:
+    return DataValidator._validate_supplier_data(dict(key))
+
+# Shared default instance plus module-level bindings of the public
+# methods, so call sites can validate without constructing (or holding)
+# a DataValidator of their own
+DEFAULT_VALIDATOR = DataValidator()
+validate_inventory_item = DataValidator.validate_inventory_item
+validate_inventory_items_batch = DataValidator.validate_inventory_items_batch
+validate_production_data_batch = DataValidator.validate_production_data_batch
+validate_stock_movement = DataValidator.validate_stock_movement
+validate_production_data = DataValidator.validate_production_data
+validate_supplier_data = DataValidator.validate_supplier_data
+validate_production_line_data = DataValidator.validate_production_line_data
+validate_alert_data = DataValidator.validate_alert_data
+validate_date_range = DataValidator.validate_date_range
+sanitize_string = DataValidator.sanitize_string
+validate_numeric_range = DataValidator.validate_numeric_range
+validate_numeric_range_array = DataValidator.validate_numeric_range_array
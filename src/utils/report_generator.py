@@ -9,11 +9,17 @@ Date: March 2022 - June 2022
 import os
 import json
 import csv
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import logging
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
@@ -22,13 +28,33 @@ except ImportError:
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
-    from openpyxl.utils.dataframe import dataframe_to_rows
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from tabulate import tabulate
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
 from ..database.connection import get_db_session
 from ..database.models import (
     InventoryItem, ProductionLine, ProductionRecord, 
@@ -37,6 +63,46 @@ from ..database.models import (
 
 logger = logging.getLogger(__name__)
 
+# List sections longer than this are streamed to JSON row by row
+# instead of being serialized as one document-sized string
+_JSON_STREAM_THRESHOLD = 500
+
+# Stock status lookup indexed by (out_of_stock << 2 | low << 1 | over);
+# encodes the same precedence as the old branch chain (out-of-stock wins,
+# then low stock, then overstock)
+_STOCK_STATUS_TABLE = (
+    'NORMAL', 'OVERSTOCK', 'LOW_STOCK', 'LOW_STOCK',
+    'OUT_OF_STOCK', 'OUT_OF_STOCK', 'OUT_OF_STOCK', 'OUT_OF_STOCK'
+)
+
+
+def _line_totals_loop(codes, planned, actual, defective, downtime, n_lines):
+    """Accumulate per-line planned/actual/defective/downtime/count in one pass"""
+    out = np.zeros((n_lines, 5), dtype=np.int64)
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        out[c, 0] += planned[i]
+        out[c, 1] += actual[i]
+        out[c, 2] += defective[i]
+        out[c, 3] += downtime[i]
+        out[c, 4] += 1
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _line_totals = njit(cache=True)(_line_totals_loop)
+else:
+    def _line_totals(codes, planned, actual, defective, downtime, n_lines):
+        """NumPy bincount fallback for the per-line totals kernel"""
+        out = np.empty((n_lines, 5), dtype=np.int64)
+        out[:, 0] = np.bincount(codes, weights=planned, minlength=n_lines)
+        out[:, 1] = np.bincount(codes, weights=actual, minlength=n_lines)
+        out[:, 2] = np.bincount(codes, weights=defective, minlength=n_lines)
+        out[:, 3] = np.bincount(codes, weights=downtime, minlength=n_lines)
+        out[:, 4] = np.bincount(codes, minlength=n_lines)
+        return out
+
+
 class ReportGenerator:
     """Comprehensive report generation for all system components"""
     
@@ -44,8 +110,42 @@ class ReportGenerator:
         """Initialize report generator"""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Short-lived cache of computed report payloads; per-key locks
+        # coalesce concurrent identical requests into one computation
+        self.cache_ttl_seconds = 60
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._key_locks = {}
+        # Format dispatch table; unavailable writers are simply absent so
+        # lookup misses fall through to the table format
+        self._writers = {
+            'json': ('.json', self._save_as_json),
+            'csv': ('.csv', self._save_as_csv),
+        }
+        if EXCEL_AVAILABLE or XLSXWRITER_AVAILABLE:
+            self._writers['excel'] = ('.xlsx', self._save_as_excel)
         logger.info(f"Report generator initialized with output directory: {self.output_dir}")
     
+    def _cached_compute(self, key: tuple, builder) -> Dict[str, Any]:
+        """Return a cached payload for key, computing it at most once per TTL"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < self.cache_ttl_seconds:
+                return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            # Another thread may have finished computing while we waited
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry and time.monotonic() - entry[0] < self.cache_ttl_seconds:
+                    return entry[1]
+            
+            payload = builder()
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), payload)
+            return payload
+    
     def generate_inventory_report(self, format: str = "table", 
                                 include_movements: bool = False,
                                 date_range: Optional[tuple] = None) -> Dict[str, Any]:
@@ -53,40 +153,54 @@ class ReportGenerator:
         try:
             logger.info("Generating inventory report...")
             
-            with get_db_session() as session:
-                # Get inventory data
-                items = session.query(InventoryItem).filter(
-                    InventoryItem.is_active == True
-                ).all()
-                
-                report_data = {
-                    'metadata': {
-                        'report_type': 'inventory_status',
-                        'generated_at': datetime.utcnow().isoformat(),
-                        'total_items': len(items),
-                        'date_range': date_range
-                    },
-                    'summary': self._calculate_inventory_summary(items),
-                    'items': self._format_inventory_items(items),
-                    'categories': self._analyze_inventory_categories(items),
-                    'alerts': self._get_inventory_alerts(session)
-                }
-                
-                # Add stock movement history if requested
-                if include_movements:
-                    report_data['movements'] = self._get_stock_movements(session, date_range)
-                
-                # Generate output in requested format
-                filename = self._save_report(report_data, 'inventory', format)
-                report_data['metadata']['filename'] = filename
-                
-                logger.info(f"Inventory report generated: {filename}")
-                return report_data
+            cached = self._cached_compute(
+                ('inventory', include_movements, date_range),
+                lambda: self._compute_inventory_report(include_movements, date_range)
+            )
+            report_data = {**cached, 'metadata': dict(cached['metadata'])}
+            
+            # Generate output in requested format
+            filename = self._save_report(report_data, 'inventory', format)
+            report_data['metadata']['filename'] = filename
+            
+            logger.info(f"Inventory report generated: {filename}")
+            return report_data
                 
         except Exception as e:
             logger.error(f"Error generating inventory report: {str(e)}")
             raise
     
+    def _compute_inventory_report(self, include_movements: bool = False,
+                                date_range: Optional[tuple] = None) -> Dict[str, Any]:
+        """Build the inventory report payload without writing any files"""
+        with get_db_session() as session:
+            # Get inventory data; load suppliers up front so formatting
+            # does not issue one query per item
+            items = session.query(InventoryItem).options(
+                selectinload(InventoryItem.supplier)
+            ).filter(
+                InventoryItem.is_active == True
+            ).all()
+            
+            report_data = {
+                'metadata': {
+                    'report_type': 'inventory_status',
+                    'generated_at': datetime.utcnow().isoformat(),
+                    'total_items': len(items),
+                    'date_range': date_range
+                },
+                'summary': self._calculate_inventory_summary(session),
+                'alerts': self._get_inventory_alerts(session)
+            }
+            report_data['items'], report_data['categories'] = \
+                self._format_and_categorize_items(items)
+            
+            # Add stock movement history if requested
+            if include_movements:
+                report_data['movements'] = self._get_stock_movements(session, date_range)
+            
+            return report_data
+    
     def generate_production_report(self, format: str = "table",
                                  line_id: Optional[int] = None,
                                  date_range: Optional[tuple] = None) -> Dict[str, Any]:
@@ -94,111 +208,161 @@ class ReportGenerator:
         try:
             logger.info("Generating production report...")
             
-            if not date_range:
-                end_date = datetime.utcnow()
-                start_date = end_date - timedelta(days=7)
-                date_range = (start_date, end_date)
+            cached = self._cached_compute(
+                ('production', line_id, date_range),
+                lambda: self._compute_production_report(line_id, date_range)
+            )
+            report_data = {**cached, 'metadata': dict(cached['metadata'])}
             
-            with get_db_session() as session:
-                # Base query for production records
-                query = session.query(ProductionRecord).filter(
-                    ProductionRecord.created_at >= date_range[0],
-                    ProductionRecord.created_at <= date_range[1]
-                )
-                
-                if line_id:
-                    query = query.filter(ProductionRecord.production_line_id == line_id)
-                
-                records = query.all()
-                
-                # Get production lines
-                lines_query = session.query(ProductionLine).filter(
-                    ProductionLine.is_active == True
-                )
-                if line_id:
-                    lines_query = lines_query.filter(ProductionLine.id == line_id)
-                
-                lines = lines_query.all()
-                
-                report_data = {
-                    'metadata': {
-                        'report_type': 'production_performance',
-                        'generated_at': datetime.utcnow().isoformat(),
-                        'date_range': {
-                            'start': date_range[0].isoformat(),
-                            'end': date_range[1].isoformat()
-                        },
-                        'line_id': line_id,
-                        'total_records': len(records)
-                    },
-                    'summary': self._calculate_production_summary(records),
-                    'line_performance': self._analyze_line_performance(lines, records),
-                    'efficiency_trends': self._calculate_efficiency_trends(records),
-                    'quality_analysis': self._analyze_quality_metrics(records),
-                    'downtime_analysis': self._analyze_downtime(records)
-                }
-                
-                # Generate output in requested format
-                filename = self._save_report(report_data, 'production', format)
-                report_data['metadata']['filename'] = filename
-                
-                logger.info(f"Production report generated: {filename}")
-                return report_data
+            # Generate output in requested format
+            filename = self._save_report(report_data, 'production', format)
+            report_data['metadata']['filename'] = filename
+            
+            logger.info(f"Production report generated: {filename}")
+            return report_data
                 
         except Exception as e:
             logger.error(f"Error generating production report: {str(e)}")
             raise
     
+    def _compute_production_report(self, line_id: Optional[int] = None,
+                                 date_range: Optional[tuple] = None) -> Dict[str, Any]:
+        """Build the production report payload without writing any files"""
+        if not date_range:
+            end_date = datetime.utcnow()
+            start_date = end_date - timedelta(days=7)
+            date_range = (start_date, end_date)
+        
+        with get_db_session() as session:
+            # Shared filters; all aggregation happens SQL-side so no
+            # ProductionRecord objects are materialized
+            filters = [
+                ProductionRecord.created_at >= date_range[0],
+                ProductionRecord.created_at <= date_range[1]
+            ]
+            if line_id:
+                filters.append(ProductionRecord.production_line_id == line_id)
+            
+            # Get production lines
+            lines_query = session.query(ProductionLine).filter(
+                ProductionLine.is_active == True
+            )
+            if line_id:
+                lines_query = lines_query.filter(ProductionLine.id == line_id)
+            
+            lines = lines_query.all()
+            
+            if PANDAS_AVAILABLE:
+                # Single columnar fetch; all reductions run vectorized on
+                # the DataFrame instead of issuing one query per section
+                query = session.query(
+                    ProductionRecord.production_line_id,
+                    ProductionRecord.planned_quantity,
+                    ProductionRecord.actual_quantity,
+                    ProductionRecord.defective_quantity,
+                    ProductionRecord.downtime_minutes,
+                    ProductionRecord.quality_score,
+                    ProductionRecord.created_at
+                ).filter(*filters)
+                df = pd.read_sql(query.statement, session.bind)
+                sections = self._production_sections_from_frame(df, lines)
+            else:
+                summary = self._calculate_production_summary(session, filters)
+                sections = {
+                    'summary': summary,
+                    'line_performance': self._analyze_line_performance(session, lines, filters),
+                    'efficiency_trends': self._calculate_efficiency_trends(session, filters),
+                    'quality_analysis': self._analyze_quality_metrics(session, filters),
+                    'downtime_analysis': self._analyze_downtime(session, filters)
+                }
+            
+            report_data = {
+                'metadata': {
+                    'report_type': 'production_performance',
+                    'generated_at': datetime.utcnow().isoformat(),
+                    'date_range': {
+                        'start': date_range[0].isoformat(),
+                        'end': date_range[1].isoformat()
+                    },
+                    'line_id': line_id,
+                    'total_records': sections['summary']['records_count']
+                }
+            }
+            report_data.update(sections)
+            return report_data
+    
     def generate_optimization_report(self, format: str = "table",
                                    days: int = 30) -> Dict[str, Any]:
         """Generate optimization performance and results report"""
         try:
             logger.info("Generating optimization report...")
             
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=days)
+            cached = self._cached_compute(
+                ('optimization', days),
+                lambda: self._compute_optimization_report(days)
+            )
+            report_data = {**cached, 'metadata': dict(cached['metadata'])}
             
-            with get_db_session() as session:
-                # Get optimization results
-                results = session.query(OptimizationResult).filter(
-                    OptimizationResult.created_at >= start_date,
-                    OptimizationResult.created_at <= end_date
-                ).order_by(OptimizationResult.created_at.desc()).all()
-                
-                report_data = {
-                    'metadata': {
-                        'report_type': 'optimization_analysis',
-                        'generated_at': datetime.utcnow().isoformat(),
-                        'period_days': days,
-                        'total_optimizations': len(results)
-                    },
-                    'summary': self._calculate_optimization_summary(results),
-                    'performance_trends': self._analyze_optimization_trends(results),
-                    'algorithm_analysis': self._analyze_algorithm_performance(results),
-                    'cost_savings': self._calculate_cost_savings(results),
-                    'recommendations': self._generate_optimization_recommendations(results)
-                }
-                
-                # Generate output in requested format
-                filename = self._save_report(report_data, 'optimization', format)
-                report_data['metadata']['filename'] = filename
-                
-                logger.info(f"Optimization report generated: {filename}")
-                return report_data
+            # Generate output in requested format
+            filename = self._save_report(report_data, 'optimization', format)
+            report_data['metadata']['filename'] = filename
+            
+            logger.info(f"Optimization report generated: {filename}")
+            return report_data
                 
         except Exception as e:
             logger.error(f"Error generating optimization report: {str(e)}")
             raise
     
+    def _compute_optimization_report(self, days: int = 30) -> Dict[str, Any]:
+        """Build the optimization report payload without writing any files"""
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+        
+        with get_db_session() as session:
+            # Get optimization results
+            results = session.query(OptimizationResult).filter(
+                OptimizationResult.created_at >= start_date,
+                OptimizationResult.created_at <= end_date
+            ).order_by(OptimizationResult.created_at.desc()).all()
+            
+            return {
+                'metadata': {
+                    'report_type': 'optimization_analysis',
+                    'generated_at': datetime.utcnow().isoformat(),
+                    'period_days': days,
+                    'total_optimizations': len(results)
+                },
+                'summary': self._calculate_optimization_summary(results),
+                'performance_trends': self._analyze_optimization_trends(results),
+                'algorithm_analysis': self._analyze_algorithm_performance(results),
+                'cost_savings': self._calculate_cost_savings(results),
+                'recommendations': self._generate_optimization_recommendations(results)
+            }
+    
     def generate_executive_summary(self, format: str = "table") -> Dict[str, Any]:
         """Generate executive summary combining all key metrics"""
         try:
             logger.info("Generating executive summary...")
             
-            # Generate component reports
-            inventory_report = self.generate_inventory_report(format="json")
-            production_report = self.generate_production_report(format="json")
-            optimization_report = self.generate_optimization_report(format="json")
+            # Build component reports in memory; only the summary itself
+            # is written to disk
+            # The three component payloads hit disjoint tables and block on
+            # the database, so compute them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                inventory_future = executor.submit(
+                    self._cached_compute,
+                    ('inventory', False, None), self._compute_inventory_report)
+                production_future = executor.submit(
+                    self._cached_compute,
+                    ('production', None, None), self._compute_production_report)
+                optimization_future = executor.submit(
+                    self._cached_compute,
+                    ('optimization', 30), self._compute_optimization_report)
+                
+                inventory_report = inventory_future.result()
+                production_report = production_future.result()
+                optimization_report = optimization_future.result()
             
             # Create executive summary
             report_data = {
@@ -211,8 +375,8 @@ class ReportGenerator:
                     'inventory': {
                         'total_value': inventory_report['summary']['total_value'],
                         'items_count': inventory_report['summary']['total_items'],
-                        'low_stock_alerts': len([item for item in inventory_report['items'] 
-                                               if item['stock_status'] == 'LOW_STOCK'])
+                        'low_stock_alerts': sum(1 for item in inventory_report['items']
+                                                if item['stock_status'] == 'LOW_STOCK')
                     },
                     'production': {
                         'overall_efficiency': production_report['summary']['overall_efficiency'],
@@ -241,124 +405,257 @@ class ReportGenerator:
             logger.error(f"Error generating executive summary: {str(e)}")
             raise
     
-    def _calculate_inventory_summary(self, items: List[InventoryItem]) -> Dict[str, Any]:
-        """Calculate inventory summary statistics"""
-        total_value = sum(item.current_stock * item.unit_cost for item in items)
-        total_items = sum(item.current_stock for item in items)
-        low_stock_count = sum(1 for item in items if item.current_stock <= item.reorder_point)
-        out_of_stock_count = sum(1 for item in items if item.current_stock == 0)
+    def _calculate_inventory_summary(self, session) -> Dict[str, Any]:
+        """Calculate inventory summary statistics (aggregated in SQL)"""
+        active = InventoryItem.is_active == True
+        total_value, total_items, unique_parts = session.query(
+            func.coalesce(func.sum(InventoryItem.current_stock * InventoryItem.unit_cost), 0),
+            func.coalesce(func.sum(InventoryItem.current_stock), 0),
+            func.count(InventoryItem.id)
+        ).filter(active).one()
+        
+        low_stock_count = session.query(func.count(InventoryItem.id)).filter(
+            active, InventoryItem.current_stock <= InventoryItem.reorder_point
+        ).scalar()
+        out_of_stock_count = session.query(func.count(InventoryItem.id)).filter(
+            active, InventoryItem.current_stock == 0
+        ).scalar()
         
         return {
             'total_value': round(total_value, 2),
             'total_items': total_items,
-            'unique_parts': len(items),
+            'unique_parts': unique_parts,
             'low_stock_count': low_stock_count,
             'out_of_stock_count': out_of_stock_count,
-            'avg_stock_value': round(total_value / len(items) if items else 0, 2)
+            'avg_stock_value': round(total_value / unique_parts if unique_parts else 0, 2)
         }
     
-    def _format_inventory_items(self, items: List[InventoryItem]) -> List[Dict[str, Any]]:
-        """Format inventory items for reporting"""
+    def _format_and_categorize_items(self, items: List[InventoryItem]) -> tuple:
+        """Format inventory items and analyze categories in a single pass"""
         formatted_items = []
+        # Accumulate [items_count, total_quantity, total_value] per
+        # category as plain list slots; dicts are built once at the end
+        category_totals = defaultdict(lambda: [0, 0, 0.0])
+        item_values = []
         
         for item in items:
-            stock_status = 'NORMAL'
-            if item.current_stock == 0:
-                stock_status = 'OUT_OF_STOCK'
-            elif item.current_stock <= item.reorder_point:
-                stock_status = 'LOW_STOCK'
-            elif item.current_stock >= item.maximum_stock:
-                stock_status = 'OVERSTOCK'
+            # Hoist ORM attribute lookups used more than once
+            current_stock = item.current_stock
+            unit_cost = item.unit_cost
+            item_value = current_stock * unit_cost
             
+            stock_status = _STOCK_STATUS_TABLE[
+                (current_stock == 0) << 2
+                | (current_stock <= item.reorder_point) << 1
+                | (current_stock >= item.maximum_stock)
+            ]
+            
+            category = item.category
             formatted_items.append({
                 'part_number': item.part_number,
                 'name': item.name,
-                'category': item.category,
-                'current_stock': item.current_stock,
+                'category': category,
+                'current_stock': current_stock,
                 'minimum_stock': item.minimum_stock,
                 'reorder_point': item.reorder_point,
-                'unit_cost': item.unit_cost,
-                'total_value': round(item.current_stock * item.unit_cost, 2),
+                'unit_cost': unit_cost,
+                'total_value': item_value,
                 'stock_status': stock_status,
                 'supplier': item.supplier.name if item.supplier else 'N/A',
                 'location': item.location
             })
+            
+            totals = category_totals[category or 'Uncategorized']
+            totals[0] += 1
+            totals[1] += current_stock
+            totals[2] += item_value
+            item_values.append(item_value)
         
-        return formatted_items
-    
-    def _analyze_inventory_categories(self, items: List[InventoryItem]) -> Dict[str, Any]:
-        """Analyze inventory by categories"""
+        # Round item values once, vectorized, instead of per row
+        if item_values:
+            for formatted, value in zip(formatted_items,
+                                        np.round(item_values, 2)):
+                formatted['total_value'] = float(value)
+        
+        # Convert accumulator slots into the reported dicts
         categories = {}
+        for category, (items_count, total_quantity, total_value) in category_totals.items():
+            categories[category] = {
+                'items_count': items_count,
+                'total_quantity': total_quantity,
+                'total_value': round(total_value, 2),
+                'avg_unit_cost': round(
+                    total_value / total_quantity if total_quantity > 0 else 0, 2
+                )
+            }
         
-        for item in items:
-            category = item.category or 'Uncategorized'
-            if category not in categories:
-                categories[category] = {
-                    'items_count': 0,
-                    'total_quantity': 0,
-                    'total_value': 0,
-                    'avg_unit_cost': 0
-                }
-            
-            categories[category]['items_count'] += 1
-            categories[category]['total_quantity'] += item.current_stock
-            categories[category]['total_value'] += item.current_stock * item.unit_cost
+        return formatted_items, categories
+    
+    def _calculate_production_summary(self, session, filters: List[Any]) -> Dict[str, Any]:
+        """Calculate production summary statistics (aggregated in SQL)"""
+        total_planned, total_actual, total_defective, total_downtime, records_count = session.query(
+            func.coalesce(func.sum(ProductionRecord.planned_quantity), 0),
+            func.coalesce(func.sum(ProductionRecord.actual_quantity), 0),
+            func.coalesce(func.sum(ProductionRecord.defective_quantity), 0),
+            func.coalesce(func.sum(ProductionRecord.downtime_minutes), 0),
+            func.count(ProductionRecord.id)
+        ).filter(*filters).one()
         
-        # Calculate averages
-        for category_data in categories.values():
-            if category_data['items_count'] > 0:
-                category_data['avg_unit_cost'] = round(
-                    category_data['total_value'] / category_data['total_quantity']
-                    if category_data['total_quantity'] > 0 else 0, 2
-                )
-            category_data['total_value'] = round(category_data['total_value'], 2)
+        overall_efficiency = (total_actual / total_planned * 100) if total_planned > 0 else 0
+        quality_rate = ((total_actual - total_defective) / total_actual * 100) if total_actual > 0 else 0
         
-        return categories
+        return {
+            'total_planned': total_planned,
+            'total_actual': total_actual,
+            'total_defective': total_defective,
+            'overall_efficiency': round(overall_efficiency, 2),
+            'quality_rate': round(quality_rate, 2),
+            'total_downtime_minutes': total_downtime,
+            'records_count': records_count
+        }
     
-    def _calculate_production_summary(self, records: List[ProductionRecord]) -> Dict[str, Any]:
-        """Calculate production summary statistics"""
-        if not records:
-            return {
-                'total_planned': 0,
-                'total_actual': 0,
-                'total_defective': 0,
-                'overall_efficiency': 0,
-                'quality_rate': 0,
-                'total_downtime_minutes': 0,
-                'records_count': 0
-            }
+    def _production_sections_from_frame(self, df, lines: List[ProductionLine]) -> Dict[str, Any]:
+        """Compute all production report sections from one DataFrame"""
+        records_count = len(df)
         
-        total_planned = sum(r.planned_quantity for r in records)
-        total_actual = sum(r.actual_quantity for r in records)
-        total_defective = sum(r.defective_quantity for r in records)
-        total_downtime = sum(r.downtime_minutes for r in records)
+        if records_count:
+            total_planned = int(df['planned_quantity'].sum())
+            total_actual = int(df['actual_quantity'].sum())
+            total_defective = int(df['defective_quantity'].sum())
+            total_downtime = int(df['downtime_minutes'].sum())
+        else:
+            total_planned = total_actual = total_defective = total_downtime = 0
         
         overall_efficiency = (total_actual / total_planned * 100) if total_planned > 0 else 0
         quality_rate = ((total_actual - total_defective) / total_actual * 100) if total_actual > 0 else 0
         
-        return {
+        summary = {
             'total_planned': total_planned,
             'total_actual': total_actual,
             'total_defective': total_defective,
             'overall_efficiency': round(overall_efficiency, 2),
             'quality_rate': round(quality_rate, 2),
             'total_downtime_minutes': total_downtime,
-            'records_count': len(records)
+            'records_count': records_count
+        }
+        
+        # Per-line totals via one fused kernel pass instead of a query
+        # per line (or four separate column reductions)
+        totals_by_line = {}
+        if records_count:
+            codes, unique_ids = pd.factorize(df['production_line_id'])
+            totals = _line_totals(
+                codes.astype(np.int64),
+                df['planned_quantity'].to_numpy(np.int64),
+                df['actual_quantity'].to_numpy(np.int64),
+                df['defective_quantity'].to_numpy(np.int64),
+                df['downtime_minutes'].to_numpy(np.int64),
+                len(unique_ids)
+            )
+            totals_by_line = {
+                int(line_id): tuple(int(v) for v in totals[idx])
+                for idx, line_id in enumerate(unique_ids)
+            }
+        
+        line_performance = {}
+        for line in lines:
+            totals = totals_by_line.get(line.id)
+            if totals:
+                planned, actual, defective, downtime, count = totals
+                efficiency = (actual / planned * 100) if planned > 0 else 0
+                line_quality = ((actual - defective) / actual * 100) if actual > 0 else 0
+                line_performance[line.name] = {
+                    'planned': planned,
+                    'actual': actual,
+                    'defective': defective,
+                    'efficiency': round(efficiency, 2),
+                    'target_efficiency': line.efficiency_target * 100,
+                    'efficiency_variance': round(efficiency - (line.efficiency_target * 100), 2),
+                    'quality_rate': round(line_quality, 2),
+                    'downtime_minutes': downtime,
+                    'records_count': count
+                }
+            else:
+                line_performance[line.name] = {
+                    'planned': 0, 'actual': 0, 'defective': 0,
+                    'efficiency': 0, 'target_efficiency': line.efficiency_target * 100,
+                    'efficiency_variance': 0, 'quality_rate': 0,
+                    'downtime_minutes': 0, 'records_count': 0
+                }
+        
+        # Daily efficiency trends
+        daily_efficiency = {}
+        if records_count:
+            daily = df.groupby(df['created_at'].dt.strftime('%Y-%m-%d')).agg(
+                planned=('planned_quantity', 'sum'),
+                actual=('actual_quantity', 'sum')
+            )
+            for day, row in daily.iterrows():
+                planned = int(row.planned)
+                actual = int(row.actual)
+                daily_efficiency[day] = {
+                    'planned': planned,
+                    'actual': actual,
+                    'efficiency': round(actual / planned * 100, 2) if planned > 0 else 0
+                }
+        
+        # Quality metrics
+        if records_count:
+            quality = df['quality_score'].dropna()
+            quality_records_count = int(quality.size)
+            avg_quality_score = float(quality.mean()) if quality_records_count else 0
+            defect_rate = (total_defective / total_actual * 100) if total_actual > 0 else 0
+            quality_analysis = {
+                'avg_quality_score': round(avg_quality_score, 2),
+                'defect_rate': round(defect_rate, 2),
+                'total_defective': total_defective,
+                'quality_records_count': quality_records_count
+            }
+        else:
+            quality_analysis = {'avg_quality_score': 0, 'defect_rate': 0}
+        
+        # Downtime patterns
+        if records_count:
+            downtime_incidents = int((df['downtime_minutes'] > 0).sum())
+            downtime_analysis = {
+                'total_downtime_minutes': total_downtime,
+                'avg_downtime_per_record': round(total_downtime / records_count, 2),
+                'downtime_incidents': downtime_incidents,
+                'downtime_percentage': round(
+                    (downtime_incidents / records_count) * 100, 2
+                )
+            }
+        else:
+            downtime_analysis = {'total_downtime': 0, 'avg_downtime': 0, 'downtime_incidents': 0}
+        
+        return {
+            'summary': summary,
+            'line_performance': line_performance,
+            'efficiency_trends': daily_efficiency,
+            'quality_analysis': quality_analysis,
+            'downtime_analysis': downtime_analysis
         }
     
-    def _analyze_line_performance(self, lines: List[ProductionLine], 
-                                records: List[ProductionRecord]) -> Dict[str, Any]:
-        """Analyze performance by production line"""
+    def _analyze_line_performance(self, session, lines: List[ProductionLine],
+                                filters: List[Any]) -> Dict[str, Any]:
+        """Analyze performance by production line using a single GROUP BY query"""
+        rows = session.query(
+            ProductionRecord.production_line_id,
+            func.sum(ProductionRecord.planned_quantity),
+            func.sum(ProductionRecord.actual_quantity),
+            func.sum(ProductionRecord.defective_quantity),
+            func.sum(ProductionRecord.downtime_minutes),
+            func.count(ProductionRecord.id)
+        ).filter(*filters).group_by(ProductionRecord.production_line_id).all()
+        
+        totals_by_line = {row[0]: row[1:] for row in rows}
         line_performance = {}
         
         for line in lines:
-            line_records = [r for r in records if r.production_line_id == line.id]
+            totals = totals_by_line.get(line.id)
             
-            if line_records:
-                total_planned = sum(r.planned_quantity for r in line_records)
-                total_actual = sum(r.actual_quantity for r in line_records)
-                total_defective = sum(r.defective_quantity for r in line_records)
-                total_downtime = sum(r.downtime_minutes for r in line_records)
+            if totals:
+                total_planned, total_actual, total_defective, total_downtime, records_count = totals
                 
                 efficiency = (total_actual / total_planned * 100) if total_planned > 0 else 0
                 quality_rate = ((total_actual - total_defective) / total_actual * 100) if total_actual > 0 else 0
@@ -372,7 +669,7 @@ class ReportGenerator:
                     'efficiency_variance': round(efficiency - (line.efficiency_target * 100), 2),
                     'quality_rate': round(quality_rate, 2),
                     'downtime_minutes': total_downtime,
-                    'records_count': len(line_records)
+                    'records_count': records_count
                 }
             else:
                 line_performance[line.name] = {
@@ -390,29 +687,44 @@ class ReportGenerator:
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         base_filename = f"{report_type}_report_{timestamp}"
         
-        if format.lower() == "json":
-            filename = f"{base_filename}.json"
-            filepath = self.output_dir / filename
-            with open(filepath, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
-        
-        elif format.lower() == "csv" and PANDAS_AVAILABLE:
-            filename = f"{base_filename}.csv"
-            filepath = self.output_dir / filename
-            self._save_as_csv(report_data, filepath)
-        
-        elif format.lower() == "excel" and EXCEL_AVAILABLE and PANDAS_AVAILABLE:
-            filename = f"{base_filename}.xlsx"
-            filepath = self.output_dir / filename
-            self._save_as_excel(report_data, filepath)
-        
-        else:  # Default to table format
-            filename = f"{base_filename}.txt"
-            filepath = self.output_dir / filename
-            self._save_as_table(report_data, filepath)
+        extension, writer = self._writers.get(
+            format.lower(), ('.txt', self._save_as_table)
+        )
+        filepath = self.output_dir / f"{base_filename}{extension}"
+        writer(report_data, filepath)
         
         return str(filepath)
     
+    def _save_as_json(self, report_data: Dict[str, Any], filepath: Path):
+        """Save report as JSON, preferring orjson when it is installed"""
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report_data,
+                                     option=orjson.OPT_INDENT_2,
+                                     default=str))
+            return
+        
+        # Serialize section by section; large list sections (items,
+        # movements) are written one row at a time so the peak memory cost
+        # is a single row's JSON, not the whole document
+        dumps = json.dumps
+        with open(filepath, 'w') as f:
+            f.write('{')
+            first_section = True
+            for key, value in report_data.items():
+                f.write(',\n' if not first_section else '\n')
+                first_section = False
+                f.write(f'{dumps(key)}: ')
+                if isinstance(value, list) and len(value) > _JSON_STREAM_THRESHOLD:
+                    f.write('[')
+                    for idx, row in enumerate(value):
+                        f.write(',\n' if idx else '\n')
+                        f.write(dumps(row, default=str))
+                    f.write('\n]')
+                else:
+                    f.write(dumps(value, indent=2, default=str))
+            f.write('\n}\n')
+    
     def _save_as_table(self, report_data: Dict[str, Any], filepath: Path):
         """Save report as formatted table"""
         with open(filepath, 'w') as f:
@@ -442,10 +754,9 @@ class ReportGenerator:
         file.write("-" * len(title) + "\n")
         
         if isinstance(data, list) and data:
-            headers = list(data[0].keys())
-            rows = [[str(item.get(h, '')) for h in headers] for item in data]
-            table = tabulate(rows, headers=headers, tablefmt='grid')
-            file.write(table)
+            # tabulate consumes list-of-dicts directly; no intermediate
+            # stringified row matrix needed
+            file.write(tabulate(data, headers='keys', tablefmt='grid'))
         elif isinstance(data, dict):
             for key, value in data.items():
                 file.write(f"{key}: {value}\n")
@@ -453,14 +764,94 @@ class ReportGenerator:
         file.write("\n\n")
     
     def _save_as_csv(self, report_data: Dict[str, Any], filepath: Path):
-        """Save report as CSV using pandas"""
-        # Implementation for CSV export
-        pass
+        """Save the report's main tabular section as CSV"""
+        # First list section wins: inventory items, movements or alerts
+        rows = None
+        for section in ('items', 'movements', 'alerts'):
+            if report_data.get(section):
+                rows = report_data[section]
+                break
+        
+        with open(filepath, 'w', newline='') as f:
+            if rows:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()),
+                                        extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                # No tabular data; fall back to summary key/value pairs
+                writer = csv.writer(f)
+                writer.writerow(['metric', 'value'])
+                for key, value in report_data.get('summary', {}).items():
+                    writer.writerow([key, value])
+    
+    def _excel_sheets(self, report_data: Dict[str, Any]):
+        """Yield (sheet_name, headers, row iterable) for the Excel writers"""
+        # Summary sheet: metadata and summary as key/value pairs
+        summary_rows = [
+            (key.replace('_', ' ').title(), str(value))
+            for section in ('metadata', 'summary')
+            for key, value in report_data.get(section, {}).items()
+        ]
+        yield "Summary", ["Metric", "Value"], summary_rows
+        
+        # List sections become one sheet each with a header row
+        for section, sheet_name in (('items', 'Items'),
+                                    ('movements', 'Movements'),
+                                    ('alerts', 'Alerts')):
+            rows = report_data.get(section)
+            if not rows:
+                continue
+            headers = list(rows[0].keys())
+            yield sheet_name, headers, (
+                tuple(row.get(h, '') for h in headers) for row in rows
+            )
+        
+        # Nested dict sections (keyed by line name, category, date)
+        for section, sheet_name, key_header in (
+                ('line_performance', 'Line Performance', 'line'),
+                ('categories', 'Categories', 'category'),
+                ('efficiency_trends', 'Efficiency Trends', 'date')):
+            data = report_data.get(section)
+            if not data:
+                continue
+            headers = [key_header] + list(next(iter(data.values())).keys())
+            yield sheet_name, headers, (
+                (key,) + tuple(values.values()) for key, values in data.items()
+            )
     
     def _save_as_excel(self, report_data: Dict[str, Any], filepath: Path):
-        """Save report as Excel using openpyxl"""
-        # Implementation for Excel export
-        pass
+        """Save report as Excel, streaming rows without buffering the sheet"""
+        if XLSXWRITER_AVAILABLE:
+            # constant_memory flushes each row to disk as it is written
+            workbook = xlsxwriter.Workbook(
+                str(filepath), {'constant_memory': True}
+            )
+            header_format = workbook.add_format({'bold': True})
+            for sheet_name, headers, rows in self._excel_sheets(report_data):
+                sheet = workbook.add_worksheet(sheet_name)
+                sheet.write_row(0, 0, headers, header_format)
+                for row_idx, row in enumerate(rows, start=1):
+                    sheet.write_row(row_idx, 0, row)
+            workbook.close()
+            return
+        
+        # openpyxl write_only mode likewise serializes rows as appended
+        workbook = Workbook(write_only=True)
+        header_font = Font(bold=True)
+        
+        for sheet_name, headers, rows in self._excel_sheets(report_data):
+            sheet = workbook.create_sheet(sheet_name)
+            header_cells = []
+            for value in headers:
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.font = header_font
+                header_cells.append(cell)
+            sheet.append(header_cells)
+            for row in rows:
+                sheet.append(row)
+        
+        workbook.save(filepath)
     
     # Additional helper methods for other calculations...
     def _get_inventory_alerts(self, session) -> List[Dict[str, Any]]:
@@ -470,17 +861,20 @@ class ReportGenerator:
             Alert.is_resolved == False
         ).all()
         
+        iso = datetime.isoformat  # avoid per-row bound-method creation
         return [{
             'id': alert.id,
             'type': alert.alert_type,
             'severity': alert.severity,
             'title': alert.title,
-            'created_at': alert.created_at.isoformat()
+            'created_at': iso(alert.created_at)
         } for alert in alerts]
     
     def _get_stock_movements(self, session, date_range: Optional[tuple]) -> List[Dict[str, Any]]:
         """Get stock movement history"""
-        query = session.query(StockMovement)
+        query = session.query(StockMovement).options(
+            joinedload(StockMovement.inventory_item)
+        )
         
         if date_range:
             query = query.filter(
@@ -488,77 +882,89 @@ class ReportGenerator:
                 StockMovement.created_at <= date_range[1]
             )
         
-        movements = query.order_by(StockMovement.created_at.desc()).limit(1000).all()
+        movements = query.order_by(
+            StockMovement.created_at.desc()
+        ).limit(1000).yield_per(500)
         
+        iso = datetime.isoformat
         return [{
             'item_id': m.inventory_item_id,
             'part_number': m.inventory_item.part_number,
             'movement_type': m.movement_type,
             'quantity': m.quantity,
             'reference': m.reference_number,
-            'created_at': m.created_at.isoformat()
+            'created_at': iso(m.created_at)
         } for m in movements]
     
-    def _calculate_efficiency_trends(self, records: List[ProductionRecord]) -> Dict[str, Any]:
-        """Calculate efficiency trends over time"""
-        # Group records by date and calculate daily efficiency
-        daily_efficiency = {}
+    def _calculate_efficiency_trends(self, session, filters: List[Any]) -> Dict[str, Any]:
+        """Calculate efficiency trends over time (grouped by day in SQL)"""
+        rows = session.query(
+            func.date(ProductionRecord.created_at),
+            func.sum(ProductionRecord.planned_quantity),
+            func.sum(ProductionRecord.actual_quantity)
+        ).filter(*filters).group_by(func.date(ProductionRecord.created_at)).all()
         
-        for record in records:
-            date_key = record.created_at.date().isoformat()
-            if date_key not in daily_efficiency:
-                daily_efficiency[date_key] = {'planned': 0, 'actual': 0}
-            
-            daily_efficiency[date_key]['planned'] += record.planned_quantity
-            daily_efficiency[date_key]['actual'] += record.actual_quantity
-        
-        # Calculate efficiency percentages
-        for date_data in daily_efficiency.values():
-            if date_data['planned'] > 0:
-                date_data['efficiency'] = round(
-                    (date_data['actual'] / date_data['planned']) * 100, 2
-                )
+        daily_efficiency = {}
+        for day, planned, actual in rows:
+            if planned > 0:
+                efficiency = round((actual / planned) * 100, 2)
             else:
-                date_data['efficiency'] = 0
+                efficiency = 0
+            daily_efficiency[str(day)] = {
+                'planned': planned,
+                'actual': actual,
+                'efficiency': efficiency
+            }
         
         return daily_efficiency
     
-    def _analyze_quality_metrics(self, records: List[ProductionRecord]) -> Dict[str, Any]:
+    def _analyze_quality_metrics(self, session, filters: List[Any]) -> Dict[str, Any]:
         """Analyze quality metrics from production records"""
-        if not records:
-            return {'avg_quality_score': 0, 'defect_rate': 0}
+        records_count, total_actual, total_defective = session.query(
+            func.count(ProductionRecord.id),
+            func.coalesce(func.sum(ProductionRecord.actual_quantity), 0),
+            func.coalesce(func.sum(ProductionRecord.defective_quantity), 0)
+        ).filter(*filters).one()
         
-        total_quality_score = sum(r.quality_score for r in records if r.quality_score)
-        quality_records = [r for r in records if r.quality_score is not None]
+        if not records_count:
+            return {'avg_quality_score': 0, 'defect_rate': 0}
         
-        total_actual = sum(r.actual_quantity for r in records)
-        total_defective = sum(r.defective_quantity for r in records)
+        total_quality_score, quality_records_count = session.query(
+            func.coalesce(func.sum(ProductionRecord.quality_score), 0),
+            func.count(ProductionRecord.id)
+        ).filter(*filters, ProductionRecord.quality_score.isnot(None)).one()
         
-        avg_quality_score = (total_quality_score / len(quality_records)) if quality_records else 0
+        avg_quality_score = (total_quality_score / quality_records_count) if quality_records_count else 0
         defect_rate = (total_defective / total_actual * 100) if total_actual > 0 else 0
         
         return {
             'avg_quality_score': round(avg_quality_score, 2),
             'defect_rate': round(defect_rate, 2),
             'total_defective': total_defective,
-            'quality_records_count': len(quality_records)
+            'quality_records_count': quality_records_count
         }
     
-    def _analyze_downtime(self, records: List[ProductionRecord]) -> Dict[str, Any]:
+    def _analyze_downtime(self, session, filters: List[Any]) -> Dict[str, Any]:
         """Analyze downtime patterns"""
-        if not records:
+        total_downtime, records_count = session.query(
+            func.coalesce(func.sum(ProductionRecord.downtime_minutes), 0),
+            func.count(ProductionRecord.id)
+        ).filter(*filters).one()
+        
+        if not records_count:
             return {'total_downtime': 0, 'avg_downtime': 0, 'downtime_incidents': 0}
         
-        total_downtime = sum(r.downtime_minutes for r in records)
-        downtime_records = [r for r in records if r.downtime_minutes > 0]
+        downtime_incidents = session.query(func.count(ProductionRecord.id)).filter(
+            *filters, ProductionRecord.downtime_minutes > 0
+        ).scalar()
         
         return {
             'total_downtime_minutes': total_downtime,
-            'avg_downtime_per_record': round(total_downtime / len(records), 2),
-            'downtime_incidents': len(downtime_records),
+            'avg_downtime_per_record': round(total_downtime / records_count, 2),
+            'downtime_incidents': downtime_incidents,
             'downtime_percentage': round(
-                (len(downtime_records) / len(records)) * 100, 2
-            ) if records else 0
+                (downtime_incidents / records_count) * 100, 2
+            )
         }
     
     def _calculate_optimization_summary(self, results: List[OptimizationResult]) -> Dict[str, Any]:
@@ -571,16 +977,22 @@ class ReportGenerator:
                 'avg_objective_value': 0
             }
         
-        successful = [r for r in results if r.status == 'COMPLETED']
-        total_execution_time = sum(r.execution_time_seconds for r in results)
-        total_objective_value = sum(r.objective_value for r in successful)
+        # One pass: count successes and accumulate both totals together
+        successful_count = 0
+        total_execution_time = 0.0
+        total_objective_value = 0.0
+        for r in results:
+            total_execution_time += r.execution_time_seconds
+            if r.status == 'COMPLETED':
+                successful_count += 1
+                total_objective_value += r.objective_value
         
         return {
             'total_optimizations': len(results),
-            'successful_optimizations': len(successful),
-            'success_rate': round((len(successful) / len(results)) * 100, 2),
+            'successful_optimizations': successful_count,
+            'success_rate': round((successful_count / len(results)) * 100, 2),
             'avg_execution_time': round(total_execution_time / len(results), 2),
-            'avg_objective_value': round(total_objective_value / len(successful), 2) if successful else 0
+            'avg_objective_value': round(total_objective_value / successful_count, 2) if successful_count else 0
         }
     
     def _analyze_optimization_trends(self, results: List[OptimizationResult]) -> Dict[str, Any]:
@@ -635,7 +1047,7 @@ class ReportGenerator:
             recommendations.append("Consider optimizing algorithm parameters to reduce execution time")
         
         # Analyze success rate
-        success_rate = len([r for r in results if r.status == 'COMPLETED']) / len(results) * 100
+        success_rate = sum(1 for r in results if r.status == 'COMPLETED') / len(results) * 100
         if success_rate < 90:
             recommendations.append("Investigate optimization failures to improve reliability")
         
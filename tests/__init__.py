@@ -52,88 +52,112 @@ Author: Hilmi Iliass
 Date: March 2022 - June 2022
 """
 
-import sys
-import os
 from pathlib import Path
+from types import MappingProxyType
 
-# Add src directory to Python path for testing
+# src path setup lives in tests/conftest.py so it runs exactly once
 PROJECT_ROOT = Path(__file__).parent.parent
-SRC_PATH = PROJECT_ROOT / 'src'
-sys.path.insert(0, str(SRC_PATH))
 
 # Test configuration
-TEST_DATABASE_URL = 'sqlite:///:memory:'
+# Shared-cache URI so every pooled connection sees the same in-memory DB
+TEST_DATABASE_URL = 'sqlite:///file::memory:?cache=shared&uri=true'
 TEST_LOG_LEVEL = 'WARNING'
 
+# PRAGMAs applied to every test connection: no fsync/journal work, keep
+# temp structures and a generous page cache in memory
+TEST_SQLITE_PRAGMAS = (
+    'PRAGMA synchronous=OFF',
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA locking_mode=EXCLUSIVE',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+)
+
 # Test data constants
-SAMPLE_INVENTORY_ITEMS = [
-    {
+# Read-only sample data: tuples of mapping proxies so no test can mutate
+# shared state and leak values into later tests. Use the create_sample_*
+# helpers to get a writable copy.
+SAMPLE_INVENTORY_ITEMS = (
+    MappingProxyType({
         'part_number': 'TEST-001',
         'name': 'Test Seat Frame',
         'unit_cost': 85.50,
         'current_stock': 100,
         'minimum_stock': 20,
         'reorder_point': 30
-    },
-    {
-        'part_number': 'TEST-002', 
+    }),
+    MappingProxyType({
+        'part_number': 'TEST-002',
         'name': 'Test Foam Cushion',
         'unit_cost': 25.75,
         'current_stock': 50,
         'minimum_stock': 10,
         'reorder_point': 15
-    }
-]
+    }),
+)
 
-SAMPLE_PRODUCTION_DATA = [
-    {
+SAMPLE_PRODUCTION_DATA = (
+    MappingProxyType({
         'line_name': 'Test Assembly Line 1',
         'capacity_per_hour': 25,
         'efficiency_target': 0.90
-    },
-    {
+    }),
+    MappingProxyType({
         'line_name': 'Test Assembly Line 2',
         'capacity_per_hour': 20,
         'efficiency_target': 0.85
-    }
-]
+    }),
+)
 
 # Test utilities
 def setup_test_database():
     """Setup test database with sample data"""
+    from sqlalchemy import event
     from src.database.connection import DatabaseManager
     from config.settings import TestingConfig
     
     db_manager = DatabaseManager(TEST_DATABASE_URL)
+    
+    if TEST_DATABASE_URL:
+        # Register before the first connection so the whole pool
+        # inherits the test PRAGMAs
+        @event.listens_for(db_manager.engine, "connect")
+        def _set_test_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in TEST_SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+    
     db_manager.initialize_database()
     return db_manager
 
 def cleanup_test_database(db_manager):
     """Cleanup test database after tests"""
+    from sqlalchemy.exc import SQLAlchemyError
+
     try:
         db_manager.close_all_connections()
-    except:
+    except (SQLAlchemyError, AttributeError):
+        # Best-effort teardown: the engine may already be disposed
         pass
 
+_SAMPLE_PRODUCTION_RECORD = MappingProxyType({
+    'product_id': 'TEST-PRODUCT',
+    'planned_quantity': 100,
+    'actual_quantity': 95,
+    'defective_quantity': 2,
+    'efficiency': 95.0,
+    'downtime_minutes': 10,
+    'quality_score': 98.0
+})
+
 def create_sample_inventory_item(inventory_manager, **kwargs):
     """Create sample inventory item for testing"""
-    default_data = SAMPLE_INVENTORY_ITEMS[0].copy()
-    default_data.update(kwargs)
-    return default_data
+    return {**SAMPLE_INVENTORY_ITEMS[0], **kwargs}
 
 def create_sample_production_record(**kwargs):
     """Create sample production record for testing"""
-    default_data = {
-        'product_id': 'TEST-PRODUCT',
-        'planned_quantity': 100,
-        'actual_quantity': 95,
-        'defective_quantity': 2,
-        'efficiency': 95.0,
-        'downtime_minutes': 10,
-        'quality_score': 98.0
-    }
-    default_data.update(kwargs)
-    return default_data
+    return {**_SAMPLE_PRODUCTION_RECORD, **kwargs}
 
 # Test fixtures and helpers
 class TestHelpers:
@@ -162,20 +186,17 @@ class TestHelpers:
     @staticmethod
     def mock_database_session():
         """Create mock database session for testing"""
-        from unittest.mock import Mock
-        
-        mock_session = Mock()
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        mock_session.commit = Mock()
-        mock_session.rollback = Mock()
-        mock_session.close = Mock()
-        
-        return mock_session
+        from unittest.mock import MagicMock
+        from sqlalchemy.orm import Session
+
+        # MagicMock supplies the context-manager protocol; the Session spec
+        # keeps calls limited to the real session API
+        return MagicMock(spec=Session)
 
 # Export test utilities
 __all__ = [
     'TEST_DATABASE_URL',
+    'TEST_SQLITE_PRAGMAS',
     'TEST_LOG_LEVEL',
     'SAMPLE_INVENTORY_ITEMS',
     'SAMPLE_PRODUCTION_DATA',
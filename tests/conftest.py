@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the test suite.
+
+Inserts the project's src directory onto sys.path exactly once so that
+individual test modules do not need their own path manipulation.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_PATH = str(Path(__file__).parent.parent / 'src')
+
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
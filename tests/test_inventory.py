@@ -1,509 +1,495 @@
 """
 Unit tests for ADIENT Inventory Management System - Inventory Module
+
+Run with pytest:
+
+    pytest tests/test_inventory.py
+
+With pytest-xdist installed the module parallelizes cleanly; keep tests of
+one file on one worker so module-scoped fixtures are built once:
+
+    pytest tests/test_inventory.py -n auto --dist loadfile
 """
 
-import sys
-import os
-import unittest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
-
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from src.inventory.inventory_manager import InventoryManager
-from src.database.models import InventoryItem, Supplier, StockMovement
-from config.settings import TestingConfig
-
-class TestInventoryManager(unittest.TestCase):
-    """Test cases for InventoryManager class"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.inventory_manager = InventoryManager()
-        
-        # Mock database session
-        self.mock_session = Mock()
-        self.mock_session.__enter__ = Mock(return_value=self.mock_session)
-        self.mock_session.__exit__ = Mock(return_value=None)
-        
-        # Sample test data
-        self.sample_supplier = Supplier(
-            id=1,
-            name="Test Supplier",
-            lead_time_days=5
-        )
-        
-        self.sample_item = InventoryItem(
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+# Application imports are deferred into the fixtures and tests that need
+# them so collecting this module does not pull in SQLAlchemy and the full
+# src package up front.
+
+
+@pytest.fixture(scope="session")
+def db_manager():
+    """Initialize the test database once for the whole session"""
+    from tests import setup_test_database, cleanup_test_database
+
+    manager = setup_test_database()
+    yield manager
+    cleanup_test_database(manager)
+
+
+@pytest.fixture
+def db_session(db_manager):
+    """Per-test session inside a transaction that is always rolled back"""
+    connection = db_manager.engine.connect()
+    transaction = connection.begin()
+    session = db_manager.SessionLocal(bind=connection)
+    session.begin_nested()
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    """Canonical sample dicts, built once per session"""
+    from tests import SAMPLE_INVENTORY_ITEMS, SAMPLE_PRODUCTION_DATA
+
+    return {
+        'inventory_items': SAMPLE_INVENTORY_ITEMS,
+        'production_data': SAMPLE_PRODUCTION_DATA,
+    }
+
+
+@pytest.fixture(scope="module")
+def inventory_manager():
+    """InventoryManager under test; module-scoped since it holds no per-test state"""
+    from src.inventory.inventory_manager import InventoryManager
+
+    return InventoryManager()
+
+
+def configure_query(session, *, all_result=None, first_result=None,
+                    scalar_result=None):
+    """Set the terminal results of a session.query(...).filter(...) chain"""
+    chain = session.query.return_value.filter.return_value
+    if all_result is not None:
+        chain.all.return_value = all_result
+    if first_result is not None:
+        chain.first.return_value = first_result
+    if scalar_result is not None:
+        chain.scalar.return_value = scalar_result
+    return chain
+
+
+@pytest.fixture(scope="module")
+def _session_mock():
+    """One autospec'd session graph per module; reset between tests"""
+    from sqlalchemy.orm import Session
+
+    return create_autospec(Session, instance=True)
+
+
+@pytest.fixture
+def mock_session(_session_mock):
+    """Mock database session usable as a context manager"""
+    _session_mock.reset_mock(return_value=True, side_effect=True)
+    _session_mock.__enter__.return_value = _session_mock
+    _session_mock.__exit__.return_value = None
+    # Aggregate queries (average consumption) read scalar(); default to 0
+    # so unconfigured tests see "no consumption" rather than a mock object
+    configure_query(_session_mock, scalar_result=0)
+    return _session_mock
+
+
+@pytest.fixture
+def patched_session(monkeypatch, mock_session):
+    """Route get_db_session in the inventory module to the mock session"""
+    monkeypatch.setattr('src.inventory.inventory_manager.get_db_session',
+                        lambda: mock_session)
+    return mock_session
+
+
+@pytest.fixture(scope="session")
+def sample_supplier():
+    """Sample supplier; tests only read its attributes"""
+    from src.database.models import Supplier
+
+    return Supplier(
+        id=1,
+        name="Test Supplier",
+        lead_time_days=5
+    )
+
+
+@pytest.fixture
+def sample_item(sample_supplier):
+    """Sample inventory item; function-scoped because tests mutate stock"""
+    from src.database.models import InventoryItem
+
+    return InventoryItem(
+        id=1,
+        part_number="TEST-001",
+        name="Test Item",
+        current_stock=100,
+        minimum_stock=20,
+        maximum_stock=500,
+        reorder_point=50,
+        reorder_quantity=200,
+        unit_cost=25.50,
+        supplier=sample_supplier
+    )
+
+
+@pytest.fixture(scope="session")
+def low_stock_items():
+    """Two items below reorder point; session-scoped since tests only read them"""
+    from src.database.models import InventoryItem, Supplier
+
+    return [
+        InventoryItem(
             id=1,
-            part_number="TEST-001",
-            name="Test Item",
-            current_stock=100,
-            minimum_stock=20,
-            maximum_stock=500,
-            reorder_point=50,
-            reorder_quantity=200,
-            unit_cost=25.50,
-            supplier=self.sample_supplier
-        )
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_get_all_inventory_items(self, mock_get_session):
-        """Test getting all inventory items"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.all.return_value = [self.sample_item]
-        
-        # Execute
-        result = self.inventory_manager.get_all_inventory_items()
-        
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]['part_number'], 'TEST-001')
-        self.assertEqual(result[0]['current_stock'], 100)
-        self.assertEqual(result[0]['supplier_name'], 'Test Supplier')
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_get_inventory_item_by_id(self, mock_get_session):
-        """Test getting specific inventory item by ID"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.first.return_value = self.sample_item
-        
-        # Mock recent movements
-        with patch.object(self.inventory_manager, '_get_recent_movements', return_value=[]):
-            result = self.inventory_manager.get_inventory_item(1)
-        
-        # Assert
-        self.assertIsNotNone(result)
-        self.assertEqual(result['id'], 1)
-        self.assertEqual(result['part_number'], 'TEST-001')
-        self.assertIn('stock_metrics', result)
-        self.assertIn('supplier', result)
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_update_stock_in_movement(self, mock_get_session):
-        """Test updating stock with IN movement"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.first.return_value = self.sample_item
-        
-        # Mock the check_stock_alerts method
-        with patch.object(self.inventory_manager, '_check_stock_alerts'):
-            result = self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=50,
-                movement_type='IN',
-                reference_number='PO-123',
-                reason='Purchase order delivery'
-            )
-        
-        # Assert
-        self.assertTrue(result)
-        self.assertEqual(self.sample_item.current_stock, 150)  # 100 + 50
-        self.mock_session.add.assert_called()
-        self.mock_session.commit.assert_called()
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_update_stock_out_movement(self, mock_get_session):
-        """Test updating stock with OUT movement"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.first.return_value = self.sample_item
-        
-        # Mock the check_stock_alerts method
-        with patch.object(self.inventory_manager, '_check_stock_alerts'):
-            result = self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=30,
-                movement_type='OUT',
-                reference_number='WO-456',
-                reason='Production consumption'
-            )
-        
-        # Assert
-        self.assertTrue(result)
-        self.assertEqual(self.sample_item.current_stock, 70)  # 100 - 30
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_update_stock_insufficient_stock(self, mock_get_session):
-        """Test updating stock with insufficient stock for OUT movement"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.first.return_value = self.sample_item
-        
-        # Execute and assert exception
-        with self.assertRaises(ValueError) as context:
-            self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=150,  # More than current stock (100)
-                movement_type='OUT'
-            )
-        
-        self.assertIn("Insufficient stock", str(context.exception))
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_get_low_stock_items(self, mock_get_session):
-        """Test getting low stock items"""
-        # Create low stock item
-        low_stock_item = InventoryItem(
-            id=2,
-            part_number="LOW-001",
-            name="Low Stock Item",
-            current_stock=15,  # Below reorder point
+            part_number="REORDER-001",
+            name="Low Stock Item 1",
+            current_stock=10,
             reorder_point=20,
             reorder_quantity=100,
-            unit_cost=10.00,
-            supplier=self.sample_supplier
-        )
-        
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.all.return_value = [low_stock_item]
-        
-        # Execute
-        result = self.inventory_manager.get_low_stock_items()
-        
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]['part_number'], 'LOW-001')
-        self.assertEqual(result[0]['current_stock'], 15)
-        self.assertGreater(result[0]['urgency_score'], 0)
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_generate_reorder_suggestions(self, mock_get_session):
-        """Test generating reorder suggestions"""
-        # Mock get_low_stock_items
-        with patch.object(self.inventory_manager, 'get_low_stock_items') as mock_low_stock:
-            mock_low_stock.return_value = [{
-                'id': 1,
-                'part_number': 'TEST-001',
-                'name': 'Test Item',
-                'current_stock': 15,
-                'reorder_point': 20,
-                'reorder_quantity': 100,
-                'supplier_name': 'Test Supplier',
-                'lead_time_days': 5,
-                'urgency_score': 75.0
-            }]
-            
-            # Mock _get_item_cost
-            with patch.object(self.inventory_manager, '_get_item_cost', return_value=25.50):
-                result = self.inventory_manager.generate_reorder_suggestions()
-        
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]['part_number'], 'TEST-001')
-        self.assertIn('suggested_quantity', result[0])
-        self.assertIn('estimated_cost', result[0])
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_get_stock_valuation(self, mock_get_session):
-        """Test calculating stock valuation"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.all.return_value = [self.sample_item]
-        
-        # Execute
-        result = self.inventory_manager.get_stock_valuation()
-        
-        # Assert
-        expected_value = 100 * 25.50  # current_stock * unit_cost
-        self.assertEqual(result['total_value'], expected_value)
-        self.assertEqual(result['total_items'], 100)
-        self.assertEqual(result['unique_parts'], 1)
-    
-    def test_calculate_stock_metrics(self):
-        """Test calculating stock metrics"""
-        # Mock average consumption calculation
-        with patch.object(self.inventory_manager, '_calculate_average_consumption', return_value=2.5):
-            result = self.inventory_manager._calculate_stock_metrics(self.sample_item)
-        
-        # Assert
-        self.assertIn('status', result)
-        self.assertIn('days_of_supply', result)
-        self.assertIn('reorder_needed', result)
-        self.assertEqual(result['days_of_supply'], 40.0)  # 100 / 2.5
-        self.assertFalse(result['reorder_needed'])  # 100 > 50 (reorder_point)
-    
-    def test_calculate_stock_metrics_low_stock(self):
-        """Test calculating stock metrics for low stock item"""
-        # Create low stock item
-        low_stock_item = InventoryItem(
+            unit_cost=15.00,
+            supplier=Supplier(name="Supplier A", lead_time_days=5)
+        ),
+        InventoryItem(
             id=2,
-            part_number="LOW-001",
-            name="Low Stock Item",
-            current_stock=15,
-            reorder_point=20,
-            unit_cost=10.00
+            part_number="REORDER-002",
+            name="Low Stock Item 2",
+            current_stock=5,
+            reorder_point=15,
+            reorder_quantity=75,
+            unit_cost=25.00,
+            supplier=Supplier(name="Supplier B", lead_time_days=7)
+        ),
+    ]
+
+
+def test_get_all_inventory_items(inventory_manager,
+                                 patched_session, sample_item):
+    """Test getting all inventory items"""
+    configure_query(patched_session, all_result=[sample_item])
+
+    # Execute
+    result = inventory_manager.get_all_inventory_items()
+
+    # Assert
+    assert len(result) == 1
+    assert result[0]['part_number'] == 'TEST-001'
+    assert result[0]['current_stock'] == 100
+    assert result[0]['supplier_name'] == 'Test Supplier'
+
+
+def test_get_inventory_item_by_id(inventory_manager,
+                                  patched_session, sample_item):
+    """Test getting specific inventory item by ID"""
+    configure_query(patched_session, first_result=sample_item)
+
+    # Mock recent movements
+    with patch.object(inventory_manager, '_get_recent_movements', return_value=[]):
+        result = inventory_manager.get_inventory_item(1)
+
+    # Assert
+    assert result is not None
+    assert result['id'] == 1
+    assert result['part_number'] == 'TEST-001'
+    assert 'stock_metrics' in result
+    assert 'supplier' in result
+
+
+@pytest.mark.parametrize("quantity,movement_type,expected_stock", [
+    (50, 'IN', 150),   # 100 + 50
+    (30, 'OUT', 70),   # 100 - 30
+])
+def test_update_stock_movement(inventory_manager,
+                               patched_session, sample_item,
+                               quantity, movement_type, expected_stock):
+    """Test updating stock with IN and OUT movements"""
+    configure_query(patched_session, first_result=sample_item)
+
+    # Mock the check_stock_alerts method
+    with patch.object(inventory_manager, '_check_stock_alerts'):
+        result = inventory_manager.update_stock(
+            item_id=1,
+            quantity=quantity,
+            movement_type=movement_type,
+            reference_number='REF-123',
+            reason='Stock movement test'
         )
-        
-        # Mock average consumption calculation
-        with patch.object(self.inventory_manager, '_calculate_average_consumption', return_value=1.0):
-            result = self.inventory_manager._calculate_stock_metrics(low_stock_item)
-        
-        # Assert
-        self.assertEqual(result['status'], 'LOW_STOCK')
-        self.assertTrue(result['reorder_needed'])
-        self.assertGreater(result['urgency_score'], 0)
-    
-    def test_calculate_stock_metrics_out_of_stock(self):
-        """Test calculating stock metrics for out of stock item"""
-        # Create out of stock item
-        out_of_stock_item = InventoryItem(
-            id=3,
-            part_number="OUT-001",
-            name="Out of Stock Item",
-            current_stock=0,
-            reorder_point=10,
-            unit_cost=15.00
+
+    # Assert
+    assert result is True
+    assert sample_item.current_stock == expected_stock
+    patched_session.add.assert_called()
+    patched_session.commit.assert_called()
+
+
+def test_update_stock_insufficient_stock(inventory_manager,
+                                         patched_session, sample_item):
+    """Test updating stock with insufficient stock for OUT movement"""
+    configure_query(patched_session, first_result=sample_item)
+
+    # Execute and assert exception
+    with pytest.raises(ValueError) as exc_info:
+        inventory_manager.update_stock(
+            item_id=1,
+            quantity=150,  # More than current stock (100)
+            movement_type='OUT'
         )
-        
-        # Mock average consumption calculation
-        with patch.object(self.inventory_manager, '_calculate_average_consumption', return_value=0.5):
-            result = self.inventory_manager._calculate_stock_metrics(out_of_stock_item)
-        
-        # Assert
-        self.assertEqual(result['status'], 'OUT_OF_STOCK')
-        self.assertTrue(result['reorder_needed'])
-        self.assertEqual(result['days_of_supply'], 0)
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_calculate_average_consumption(self, mock_get_session):
-        """Test calculating average consumption"""
-        # Setup mock
-        mock_get_session.return_value = self.mock_session
-        self.mock_session.query.return_value.filter.return_value.scalar.return_value = 150  # Total OUT in 30 days
-        
-        # Execute
-        result = self.inventory_manager._calculate_average_consumption(1, 30)
-        
-        # Assert
-        self.assertEqual(result, 5.0)  # 150 / 30
-    
-    def test_calculate_optimal_reorder_quantity(self):
-        """Test calculating optimal reorder quantity"""
-        item_data = {
-            'reorder_quantity': 100,
+
+    assert "Insufficient stock" in str(exc_info.value)
+
+
+def test_get_low_stock_items(inventory_manager,
+                             patched_session, sample_supplier):
+    """Test getting low stock items"""
+    from src.database.models import InventoryItem
+
+    # Create low stock item
+    low_stock_item = InventoryItem(
+        id=2,
+        part_number="LOW-001",
+        name="Low Stock Item",
+        current_stock=15,  # Below reorder point
+        reorder_point=20,
+        reorder_quantity=100,
+        unit_cost=10.00,
+        supplier=sample_supplier
+    )
+
+    configure_query(patched_session, all_result=[low_stock_item])
+
+    # Execute
+    result = inventory_manager.get_low_stock_items()
+
+    # Assert
+    assert len(result) == 1
+    assert result[0]['part_number'] == 'LOW-001'
+    assert result[0]['current_stock'] == 15
+    assert result[0]['urgency_score'] > 0
+
+
+def test_generate_reorder_suggestions(inventory_manager):
+    """Test generating reorder suggestions"""
+    # Mock get_low_stock_items
+    with patch.object(inventory_manager, 'get_low_stock_items') as mock_low_stock:
+        mock_low_stock.return_value = [{
+            'id': 1,
+            'part_number': 'TEST-001',
+            'name': 'Test Item',
             'current_stock': 15,
-            'reorder_point': 20
-        }
-        
-        result = self.inventory_manager._calculate_optimal_reorder_quantity(item_data)
-        
-        # Assert
-        expected = 100 + (20 - 15)  # base_quantity + deficit
-        self.assertEqual(result, expected)
-    
-    def test_validator_integration(self):
-        """Test that validator is properly integrated"""
-        # Test invalid stock movement
-        with self.assertRaises(ValueError):
-            self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=-10,  # Invalid negative quantity
-                movement_type='IN'
-            )
-
-
-class TestInventoryValidation(unittest.TestCase):
-    """Test cases for inventory data validation"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.inventory_manager = InventoryManager()
-    
-    def test_validate_positive_quantities(self):
-        """Test validation of positive quantities"""
-        # Valid positive quantity
-        self.assertTrue(
-            self.inventory_manager.validator.validate_stock_movement(50, 'IN')
+            'reorder_point': 20,
+            'reorder_quantity': 100,
+            'supplier_name': 'Test Supplier',
+            'lead_time_days': 5,
+            'urgency_score': 75.0
+        }]
+
+        # Mock _get_item_cost
+        with patch.object(inventory_manager, '_get_item_cost', return_value=25.50):
+            result = inventory_manager.generate_reorder_suggestions()
+
+    # Assert
+    assert len(result) == 1
+    assert result[0]['part_number'] == 'TEST-001'
+    assert 'suggested_quantity' in result[0]
+    assert 'estimated_cost' in result[0]
+
+
+def test_get_stock_valuation(inventory_manager,
+                             patched_session, sample_item):
+    """Test calculating stock valuation"""
+    configure_query(patched_session, all_result=[sample_item])
+
+    # Execute
+    result = inventory_manager.get_stock_valuation()
+
+    # Assert
+    expected_value = 100 * 25.50  # current_stock * unit_cost
+    assert result['total_value'] == expected_value
+    assert result['total_items'] == 100
+    assert result['unique_parts'] == 1
+
+
+@pytest.mark.parametrize(
+    "stock,reorder_point,consumption,expected_status,expected_days,reorder_needed", [
+        (100, 50, 2.5, 'NORMAL', 40.0, False),
+        (15, 20, 1.0, 'LOW_STOCK', 15.0, True),
+        (0, 10, 0.5, 'OUT_OF_STOCK', 0, True),
+    ])
+def test_calculate_stock_metrics(inventory_manager, stock, reorder_point,
+                                 consumption, expected_status, expected_days,
+                                 reorder_needed):
+    """Test calculating stock metrics across stock levels"""
+    from src.database.models import InventoryItem
+
+    item = InventoryItem(
+        id=2,
+        part_number="METRIC-001",
+        name="Metrics Test Item",
+        current_stock=stock,
+        reorder_point=reorder_point,
+        maximum_stock=500,
+        unit_cost=10.00
+    )
+
+    # Mock average consumption calculation
+    with patch.object(inventory_manager, '_calculate_average_consumption',
+                      return_value=consumption):
+        result = inventory_manager._calculate_stock_metrics(item)
+
+    # Assert
+    assert result['status'] == expected_status
+    assert result['days_of_supply'] == expected_days
+    assert result['reorder_needed'] is reorder_needed
+    if reorder_needed:
+        assert result['urgency_score'] > 0
+
+
+def test_calculate_average_consumption(inventory_manager,
+                                       patched_session):
+    """Test calculating average consumption"""
+    configure_query(patched_session, scalar_result=150)  # Total OUT in 30 days
+
+    # Execute
+    result = inventory_manager._calculate_average_consumption(1, 30)
+
+    # Assert
+    assert result == 5.0  # 150 / 30
+
+
+def test_calculate_optimal_reorder_quantity(inventory_manager):
+    """Test calculating optimal reorder quantity"""
+    item_data = {
+        'reorder_quantity': 100,
+        'current_stock': 15,
+        'reorder_point': 20
+    }
+
+    result = inventory_manager._calculate_optimal_reorder_quantity(item_data)
+
+    # Assert
+    expected = 100 + (20 - 15)  # base_quantity + deficit
+    assert result == expected
+
+
+def test_validator_integration(inventory_manager):
+    """Test that validator is properly integrated"""
+    # Test invalid stock movement
+    with pytest.raises(ValueError):
+        inventory_manager.update_stock(
+            item_id=1,
+            quantity=-10,  # Invalid negative quantity
+            movement_type='IN'
         )
-        
-        # Invalid negative quantity for IN movement
-        self.assertFalse(
-            self.inventory_manager.validator.validate_stock_movement(-10, 'IN')
+
+
+@pytest.mark.parametrize("quantity,movement_type,expected", [
+    (50, 'IN', True),
+    (-10, 'IN', False),    # negative quantity
+    (0, 'OUT', False),     # zero quantity
+    (10, 'IN', True),
+    (10, 'OUT', True),
+    (10, 'ADJUSTMENT', True),
+    (10, 'INVALID', False),  # unknown movement type
+])
+def test_validate_stock_movement(inventory_manager, quantity, movement_type, expected):
+    """Test stock movement validation across quantities and movement types"""
+    assert inventory_manager.validator.validate_stock_movement(
+        quantity, movement_type) is expected
+
+
+def test_stock_movement_workflow(inventory_manager,
+                                 patched_session):
+    """Test complete stock movement workflow"""
+    from src.database.models import InventoryItem
+
+    # Create test item
+    test_item = InventoryItem(
+        id=1,
+        part_number="FLOW-001",
+        name="Workflow Test Item",
+        current_stock=100,
+        reorder_point=20
+    )
+
+    configure_query(patched_session, first_result=test_item)
+
+    # Mock the alert checking
+    with patch.object(inventory_manager, '_check_stock_alerts'):
+        # Test IN movement
+        result = inventory_manager.update_stock(
+            item_id=1,
+            quantity=50,
+            movement_type='IN',
+            reference_number='TEST-001'
         )
-        
-        # Invalid zero quantity for OUT movement
-        self.assertFalse(
-            self.inventory_manager.validator.validate_stock_movement(0, 'OUT')
+
+        assert result is True
+        assert test_item.current_stock == 150
+
+        # Test OUT movement
+        result = inventory_manager.update_stock(
+            item_id=1,
+            quantity=30,
+            movement_type='OUT',
+            reference_number='TEST-002'
         )
-    
-    def test_validate_movement_types(self):
-        """Test validation of movement types"""
-        valid_types = ['IN', 'OUT', 'ADJUSTMENT']
-        
-        for movement_type in valid_types:
-            self.assertTrue(
-                self.inventory_manager.validator.validate_stock_movement(10, movement_type)
-            )
-        
-        # Invalid movement type
-        self.assertFalse(
-            self.inventory_manager.validator.validate_stock_movement(10, 'INVALID')
+
+        assert result is True
+        assert test_item.current_stock == 120
+
+
+def test_reorder_workflow(inventory_manager,
+                          patched_session, low_stock_items):
+    """Test reorder suggestion workflow"""
+    configure_query(patched_session, all_result=low_stock_items)
+
+    # Execute
+    result = inventory_manager.get_low_stock_items()
+
+    # Assert
+    assert len(result) == 2
+
+    # Check urgency ordering (item 2 should be more urgent due to lower stock ratio)
+    assert result[0]['urgency_score'] > result[1]['urgency_score']
+
+
+def test_update_stock_item_not_found(inventory_manager,
+                                     patched_session):
+    """Test updating stock for non-existent item"""
+    configure_query(patched_session).first.return_value = None
+
+    # Execute and assert
+    with pytest.raises(ValueError) as exc_info:
+        inventory_manager.update_stock(
+            item_id=999,  # Non-existent item
+            quantity=10,
+            movement_type='IN'
         )
 
+    assert "not found" in str(exc_info.value)
 
-class TestInventoryIntegration(unittest.TestCase):
-    """Integration tests for inventory management"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.inventory_manager = InventoryManager()
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_stock_movement_workflow(self, mock_get_session):
-        """Test complete stock movement workflow"""
-        # Setup mock
-        mock_session = Mock()
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        mock_get_session.return_value = mock_session
-        
-        # Create test item
-        test_item = InventoryItem(
-            id=1,
-            part_number="FLOW-001",
-            name="Workflow Test Item",
-            current_stock=100,
-            reorder_point=20
+
+def test_invalid_movement_data(inventory_manager):
+    """Test handling of invalid movement data"""
+    # Test invalid quantity type
+    with pytest.raises(ValueError):
+        inventory_manager.update_stock(
+            item_id=1,
+            quantity="invalid",  # String instead of int
+            movement_type='IN'
         )
-        
-        mock_session.query.return_value.filter.return_value.first.return_value = test_item
-        
-        # Mock the alert checking
-        with patch.object(self.inventory_manager, '_check_stock_alerts'):
-            # Test IN movement
-            result = self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=50,
-                movement_type='IN',
-                reference_number='TEST-001'
-            )
-            
-            self.assertTrue(result)
-            self.assertEqual(test_item.current_stock, 150)
-            
-            # Test OUT movement
-            result = self.inventory_manager.update_stock(
-                item_id=1,
-                quantity=30,
-                movement_type='OUT',
-                reference_number='TEST-002'
-            )
-            
-            self.assertTrue(result)
-            self.assertEqual(test_item.current_stock, 120)
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_reorder_workflow(self, mock_get_session):
-        """Test reorder suggestion workflow"""
-        # Setup mock
-        mock_session = Mock()
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        mock_get_session.return_value = mock_session
-        
-        # Create low stock items
-        low_stock_items = [
-            InventoryItem(
-                id=1,
-                part_number="REORDER-001",
-                name="Low Stock Item 1",
-                current_stock=10,
-                reorder_point=20,
-                reorder_quantity=100,
-                unit_cost=15.00,
-                supplier=Supplier(name="Supplier A", lead_time_days=5)
-            ),
-            InventoryItem(
-                id=2,
-                part_number="REORDER-002",
-                name="Low Stock Item 2",
-                current_stock=5,
-                reorder_point=15,
-                reorder_quantity=75,
-                unit_cost=25.00,
-                supplier=Supplier(name="Supplier B", lead_time_days=7)
-            )
-        ]
-        
-        mock_session.query.return_value.filter.return_value.all.return_value = low_stock_items
-        
-        # Execute
-        result = self.inventory_manager.get_low_stock_items()
-        
-        # Assert
-        self.assertEqual(len(result), 2)
-        
-        # Check urgency ordering (item 2 should be more urgent due to lower stock ratio)
-        self.assertGreater(result[0]['urgency_score'], result[1]['urgency_score'])
-
-
-class TestInventoryErrorHandling(unittest.TestCase):
-    """Test error handling in inventory management"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.inventory_manager = InventoryManager()
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_update_stock_item_not_found(self, mock_get_session):
-        """Test updating stock for non-existent item"""
-        # Setup mock
-        mock_session = Mock()
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        mock_get_session.return_value = mock_session
-        
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-        
-        # Execute and assert
-        with self.assertRaises(ValueError) as context:
-            self.inventory_manager.update_stock(
-                item_id=999,  # Non-existent item
-                quantity=10,
-                movement_type='IN'
-            )
-        
-        self.assertIn("not found", str(context.exception))
-    
-    def test_invalid_movement_data(self):
-        """Test handling of invalid movement data"""
-        # Test invalid quantity type
-        with self.assertRaises(ValueError):
-            self.inventory_manager.update_stock(
-                item_id=1,
-                quantity="invalid",  # String instead of int
-                movement_type='IN'
-            )
-    
-    @patch('src.inventory.inventory_manager.get_db_session')
-    def test_database_error_handling(self, mock_get_session):
-        """Test handling of database errors"""
-        # Setup mock to raise exception
-        mock_get_session.side_effect = Exception("Database connection error")
-        
-        # Execute and assert
-        with self.assertRaises(Exception):
-            self.inventory_manager.get_all_inventory_items()
-
-
-if __name__ == '__main__':
-    # Create test suite
-    test_loader = unittest.TestLoader()
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTests(test_loader.loadTestsFromTestCase(TestInventoryManager))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(TestInventoryValidation))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(TestInventoryIntegration))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(TestInventoryErrorHandling))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+
+
+def test_database_error_handling(monkeypatch, inventory_manager):
+    """Test handling of database errors"""
+    # Make get_db_session itself fail
+    def _raise_connection_error():
+        raise Exception("Database connection error")
+
+    monkeypatch.setattr('src.inventory.inventory_manager.get_db_session',
+                        _raise_connection_error)
+
+    # Execute and assert
+    with pytest.raises(Exception, match="Database connection error"):
+        inventory_manager.get_all_inventory_items()
+